@@ -5,12 +5,10 @@ mcp = FastMCP("sequential_thinking")
 @mcp.tool()
 def think(message: str, steps: int = 3):
     """Schrittweises Denken und Reasoning."""
-    chain = []
-    for i in range(steps):
-        chain.append({
-            "step": i + 1,
-            "thought": f"Analyse Schritt {i+1}: {message}",
-        })
+    chain = [
+        {"step": i, "thought": f"Analyse Schritt {i}: {message}"}
+        for i in range(1, steps + 1)
+    ]
 
     return {
         "input": message,
@@ -12,9 +12,12 @@ Endpoints:
 """
 
 import json
+import httpx
 import uvicorn
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import StreamingResponse, JSONResponse
 from typing import Optional
 
@@ -29,13 +32,30 @@ from adapters.jarvis.adapter import get_adapter
 from core.bridge import get_bridge
 from mcp.endpoint import router as mcp_router
 from utils.logger import log_info, log_error, log_debug
+from utils.responses import GZIP_EXCLUDE_CONTENT_TYPES, ORJSONResponse
+from adapters.jarvis.maintenance_endpoints import MEMORY_SERVICE_URL
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Ein langlebiger httpx-Client (Keep-Alive Pool) zum Memory-Service."""
+    app.state.mem_client = httpx.AsyncClient(
+        base_url=MEMORY_SERVICE_URL,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+    )
+    try:
+        yield
+    finally:
+        await app.state.mem_client.aclose()
 
 
 # FastAPI App
 app = FastAPI(
     title="Jarvis Adapter + MCP Hub",
     description="Native Jarvis API → Core-Bridge + MCP Hub",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # CORS
@@ -47,6 +67,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# GZip nur für größere JSON-Responses (NDJSON/SSE-Streams bleiben unkomprimiert)
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=1024,
+    exclude_content_types=GZIP_EXCLUDE_CONTENT_TYPES,
+)
+
 # MCP Hub Endpoint einbinden
 app.include_router(mcp_router)
 
@@ -58,7 +85,7 @@ app.include_router(maintenance_router)
 @app.get("/health")
 async def health():
     """Health-Check Endpoint."""
-    return {"status": "ok", "adapter": "jarvis"}
+    return ORJSONResponse({"status": "ok", "adapter": "jarvis"})
 
 
 @app.post("/chat")
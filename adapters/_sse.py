@@ -0,0 +1,38 @@
+# adapters/_sse.py
+"""
+SSE-Helper für die Maintenance-Streams.
+
+Gemeinsamer Fast-Path für alle Adapter: Frames werden direkt als bytes
+encodiert, Responses direkt im Byte-Buffer geparst.
+"""
+
+import orjson
+
+
+def encode(data: dict) -> bytes:
+    """Encode a dict as a single SSE data frame."""
+    return b'data: ' + orjson.dumps(data) + b'\n\n'
+
+
+def decode_first(content: bytes):
+    """
+    Parse SSE response body, return JSON of the first `data:` line.
+
+    Sucht direkt im Byte-Buffer statt den Body in Zeilen zu splitten.
+    """
+    if content.startswith(b'data: '):
+        start = 6
+    else:
+        idx = content.find(b'\ndata: ')
+        if idx < 0:
+            return None
+        start = idx + 7
+
+    end = content.find(b'\n', start)
+    if end < 0:
+        end = len(content)
+
+    return orjson.loads(memoryview(content)[start:end])
+
+
+FRAME_STREAM_END = encode({"type": "stream_end"})
@@ -13,9 +13,12 @@ Endpoints:
 """
 
 import json
+import httpx
 import uvicorn
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import StreamingResponse, JSONResponse
 
 import sys
@@ -26,16 +29,42 @@ PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(_
 sys.path.insert(0, PROJECT_ROOT)
 
 from adapters.lobechat.adapter import get_adapter
+from adapters.lobechat.maintenance_endpoints import MEMORY_SERVICE_URL
 from core.bridge import get_bridge
 from mcp.endpoint import router as mcp_router
+from mcp.client_async import close_async_client
+from maintenance.worker import close_ollama_client
 from utils.logger import log_info, log_error, log_debug
+from utils.responses import GZIP_EXCLUDE_CONTENT_TYPES, ORJSONResponse
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Ein langlebiger httpx-Client (Keep-Alive Pool) zum Memory-Service, wie im Jarvis-Adapter.
+    
+    Beim Shutdown werden außerdem die geteilten Clients des Maintenance-Workers
+    (MCP + Ollama) geschlossen.
+    """
+    app.state.mem_client = httpx.AsyncClient(
+        base_url=MEMORY_SERVICE_URL,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+    )
+    try:
+        yield
+    finally:
+        await app.state.mem_client.aclose()
+        await close_async_client()
+        await close_ollama_client()
 
 
 # FastAPI App
 app = FastAPI(
     title="LobeChat Adapter + MCP Hub",
     description="Ollama-kompatible API für LobeChat → Core-Bridge + MCP Hub",
-    version="1.1.0"
+    version="1.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # CORS (LobeChat braucht das)
@@ -47,6 +76,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# GZip nur für größere JSON-Responses (NDJSON/SSE-Streams bleiben unkomprimiert)
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=1024,
+    exclude_content_types=GZIP_EXCLUDE_CONTENT_TYPES,
+)
+
 # MCP Hub Endpoint einbinden
 
 # Maintenance Endpoints
@@ -57,7 +93,7 @@ app.include_router(maintenance_router, prefix="/api/maintenance")
 @app.get("/health")
 async def health():
     """Health-Check Endpoint."""
-    return {"status": "ok", "adapter": "lobechat"}
+    return ORJSONResponse({"status": "ok", "adapter": "lobechat"})
 
 
 @app.post("/api/chat")
@@ -303,4 +339,6 @@ if __name__ == "__main__":
         host=args.host,
         port=args.port,
         reload=False,
+        loop="uvloop",
+        http="httptools",
     )
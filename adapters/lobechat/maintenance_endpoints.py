@@ -1,64 +1,102 @@
 # Maintenance Endpoints für Memory Management
 import httpx
-import json
+import orjson
 import asyncio
+import hashlib
+import time
+from typing import Optional
 from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
+from utils.responses import ORJSONResponse
 
-router = APIRouter(prefix="/api/maintenance", tags=["maintenance"])
+from adapters._sse import encode as sse, decode_first as parse_sse, FRAME_STREAM_END
+from utils.logger import log_debug
+
+router = APIRouter(
+    prefix="/api/maintenance",
+    tags=["maintenance"],
+    default_response_class=ORJSONResponse,
+)
 
 MEMORY_SERVICE_URL = "http://mcp-sql-memory:8081"
 
-def parse_sse(text: str):
-    """Parse SSE response to get JSON data."""
-    for line in text.strip().split('\n'):
-        if line.startswith('data: '):
-            return json.loads(line[6:])
-    return None
+MEM_CLIENT_MISSING = "Memory-Service-Client fehlt (app.state.mem_client wird in der App-Lifespan angelegt)"
+
+
+def get_mem_client(request: Request) -> Optional[httpx.AsyncClient]:
+    """Langlebiger Client aus der App-Lifespan (wie im Jarvis-Adapter); None ohne Lifespan."""
+    return getattr(request.app.state, "mem_client", None)
+
+# /status: Stats für ein paar Sekunden cachen, statt bei jedem Poll upstream zu fragen
+STATUS_CACHE_TTL = 2.0
+_status_cache = {"body": None, "etag": None, "expires": 0.0}
+
+# Statische Frames - einmal beim Import encodiert
+FRAME_ANALYZING = sse({"type": "task_progress", "message": "Analysiere mit AI...", "progress": 10})
+FRAME_PROCESSING = sse({"type": "task_progress", "message": "AI verarbeitet Memories...", "progress": 50})
+FRAME_COMPLETED_EMPTY = sse({"type": "completed", "stats": {"actions": {}}})
+FRAME_BACKEND_ERROR = sse({"type": "error", "message": "Backend error"})
+
 
 @router.get("/status")
-async def get_maintenance_status():
+async def get_maintenance_status(request: Request):
     """Get memory stats - CORRECT KEYS for WebUI."""
+    # WebUI pollt: innerhalb der TTL kein Upstream-Call, bei passendem ETag → 304
+    now = time.monotonic()
+    if _status_cache["body"] is not None and now < _status_cache["expires"]:
+        return _status_response(request, _status_cache["body"], _status_cache["etag"])
+    
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{MEMORY_SERVICE_URL}/mcp",
-                headers={
-                    "Content-Type": "application/json",
-                    "Accept": "application/json, text/event-stream"
-                },
-                json={
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "method": "tools/call",
-                    "params": {
-                        "name": "memory_graph_stats",
-                        "arguments": {}
-                    }
-                },
-                timeout=10.0
-            )
-            
-            if response.status_code == 200:
-                data = parse_sse(response.text)
-                if data and 'result' in data and 'structuredContent' in data['result']:
-                    stats = data['result']['structuredContent']
-                    node_types = stats.get('node_types', {})
-                    
-                    return {
-                        "memory": {
-                            "stm_entries": node_types.get('stm', 0),
-                            "mtm_entries": node_types.get('mtm', 0),
-                            "ltm_entries": node_types.get('ltm', 0),
-                            "graph_nodes": stats.get('nodes', 0),
-                            "graph_edges": stats.get('edges', 0)
-                        }
+        client = get_mem_client(request)
+        if client is None:
+            raise RuntimeError(MEM_CLIENT_MISSING)
+        
+        response = await client.post(
+            "/mcp",
+            headers={
+                "Content-Type": "application/json",
+                "Accept": "application/json, text/event-stream"
+            },
+            json={
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "tools/call",
+                "params": {
+                    "name": "memory_graph_stats",
+                    "arguments": {}
+                }
+            },
+            timeout=10.0
+        )
+        
+        if response.status_code == 200:
+            data = parse_sse(response.content)
+            if data and 'result' in data and 'structuredContent' in data['result']:
+                stats = data['result']['structuredContent']
+                node_types = stats.get('node_types', {})
+                
+                body = orjson.dumps({
+                    "memory": {
+                        "stm_entries": node_types.get('stm', 0),
+                        "mtm_entries": node_types.get('mtm', 0),
+                        "ltm_entries": node_types.get('ltm', 0),
+                        "graph_nodes": stats.get('nodes', 0),
+                        "graph_edges": stats.get('edges', 0)
                     }
-    except Exception:
-        pass
+                })
+                etag = '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+                
+                # Nur erfolgreiche Antworten cachen - Fallback wird beim nächsten Poll neu versucht
+                _status_cache["body"] = body
+                _status_cache["etag"] = etag
+                _status_cache["expires"] = now + STATUS_CACHE_TTL
+                
+                return _status_response(request, body, etag)
+    except Exception as e:
+        log_debug(f"[Maintenance] /status fallback: {e}")
     
     # Fallback
-    return {
+    return ORJSONResponse({
         "memory": {
             "stm_entries": 0,
             "mtm_entries": 0,
@@ -66,68 +104,83 @@ async def get_maintenance_status():
             "graph_nodes": 0,
             "graph_edges": 0
         }
-    }
+    })
+
 
-async def maintenance_stream(model: str, validator_model: str = None):
+def _status_response(request: Request, body: bytes, etag: str) -> Response:
+    """304 wenn der Client den Stand schon hat, sonst Body mit ETag."""
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+async def maintenance_stream(client: httpx.AsyncClient, model: str, validator_model: str = None):
     """Stream maintenance progress in WebUI format."""
     try:
+        if client is None:
+            yield sse({"type": "error", "message": MEM_CLIENT_MISSING})
+            return
+        
         # Send started event
-        yield 'data: ' + json.dumps({
+        yield sse({
             "type": "started", 
             "tasks": ["dedupe", "promote", "summarize", "graph"],
             "model": model,
             "validator": validator_model
-        }) + '\n\n'
+        })
         
         # Send initial progress
-        yield 'data: ' + json.dumps({"type": "task_start", "message": f"Starte AI Maintenance (Model: {model})..."}) + '\n\n'
-        yield 'data: ' + json.dumps({"type": "task_progress", "message": "Analysiere mit AI...", "progress": 10}) + '\n\n'
+        yield sse({"type": "task_start", "message": f"Starte AI Maintenance (Model: {model})..."})
+        yield FRAME_ANALYZING
         
-        # Call maintenance with AI params
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            response = await client.post(
-                f"{MEMORY_SERVICE_URL}/mcp",
-                headers={
-                    "Content-Type": "application/json",
-                    "Accept": "application/json, text/event-stream"
-                },
-                json={
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "method": "tools/call",
-                    "params": {
-                        "name": "maintenance_run",
-                        "arguments": {
-                            "model": model,
-                            "validator_model": validator_model or "",
-                            "ollama_url": "http://ollama:11434"
-                        }
+        # Call maintenance with AI params - Upstream-SSE zeilenweise durchreichen
+        async with client.stream(
+            "POST",
+            "/mcp",
+            headers={
+                "Content-Type": "application/json",
+                "Accept": "application/json, text/event-stream"
+            },
+            json={
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "tools/call",
+                "params": {
+                    "name": "maintenance_run",
+                    "arguments": {
+                        "model": model,
+                        "validator_model": validator_model or "",
+                        "ollama_url": "http://ollama:11434"
                     }
                 }
-            )
-            
-            yield 'data: ' + json.dumps({"type": "task_progress", "message": "AI verarbeitet Memories...", "progress": 50}) + '\n\n'
+            },
+            timeout=120.0
+        ) as response:
+            yield FRAME_PROCESSING
             
             if response.status_code == 200:
-                data = parse_sse(response.text)
-                
-                if data and 'result' in data:
+                async for line in response.aiter_lines():
+                    if not line.startswith('data: '):
+                        continue
+                    
+                    data = orjson.loads(line[6:])
+                    if not data or 'result' not in data:
+                        continue
+                    
                     result = data['result']
                     
                     # Check for errors
                     if result.get('isError'):
                         error_msg = result['content'][0]['text']
-                        yield 'data: ' + json.dumps({"type": "error", "message": error_msg}) + '\n\n'
+                        yield sse({"type": "error", "message": error_msg})
                         return
                     
                     # Parse result
                     if 'structuredContent' in result:
                         maint_result = result['structuredContent']
                         actions = maint_result.get('actions', {})
-                        stats = maint_result.get('stats', {})
                         
                         # Send completion with stats
-                        yield 'data: ' + json.dumps({"type": "completed", "stats": {"actions": actions}}) + '\n\n'
+                        yield sse({"type": "completed", "stats": {"actions": actions}})
                         
                         # Build summary message
                         dups = actions.get('duplicates_merged', 0)
@@ -139,25 +192,26 @@ async def maintenance_stream(model: str, validator_model: str = None):
                         if conflicts > 0:
                             summary += f", {conflicts} Conflicts (siehe Log)"
                         
-                        yield 'data: ' + json.dumps({"type": "status", "message": summary}) + '\n\n'
+                        yield sse({"type": "status", "message": summary})
                         
                         # Show conflict log if any
                         conflict_log = maint_result.get('conflict_log')
                         if conflict_log:
-                            yield 'data: ' + json.dumps({
+                            yield sse({
                                 "type": "warning", 
                                 "message": f"Conflict Log: {conflict_log}"
-                            }) + '\n\n'
+                            })
                     else:
-                        yield 'data: ' + json.dumps({"type": "completed", "stats": {"actions": {}}}) + '\n\n'
+                        yield FRAME_COMPLETED_EMPTY
+                    break
             else:
-                yield 'data: ' + json.dumps({"type": "error", "message": "Backend error"}) + '\n\n'
+                yield FRAME_BACKEND_ERROR
         
         # Send stream end
-        yield 'data: ' + json.dumps({"type": "stream_end"}) + '\n\n'
+        yield FRAME_STREAM_END
         
     except Exception as e:
-        yield 'data: ' + json.dumps({"type": "error", "message": str(e)}) + '\n\n'
+        yield sse({"type": "error", "message": str(e)})
 
 @router.post("/start")
 async def start_maintenance(request: Request):
@@ -172,7 +226,11 @@ async def start_maintenance(request: Request):
     validator_model = body.get('validator_model')
     
     return StreamingResponse(
-        maintenance_stream(model=model, validator_model=validator_model),
+        maintenance_stream(
+            client=get_mem_client(request),
+            model=model,
+            validator_model=validator_model
+        ),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
@@ -1,22 +1,46 @@
-# Smart AI Proxy - Streaming mit Progress Simulation
+# Smart AI Proxy - Streaming mit Progress Heartbeat
 import httpx
-import json
+import orjson
 import asyncio
 from fastapi import APIRouter, Request
 from fastapi.responses import StreamingResponse
 
+from adapters._sse import encode as sse, FRAME_STREAM_END
+from adapters.lobechat.maintenance_endpoints import MEM_CLIENT_MISSING, get_mem_client
+
 router = APIRouter(prefix="/api/maintenance", tags=["maintenance-smart"])
 
 MEMORY_SERVICE_URL = "http://mcp-sql-memory:8081"
 
-def parse_sse(text: str):
-    """Parse SSE response."""
-    for line in text.strip().split('\n'):
-        if line.startswith('data: '):
-            return json.loads(line[6:])
-    return None
+# Abstand zwischen Progress-Frames solange der Memory Service arbeitet
+HEARTBEAT_INTERVAL = 0.8
+
+# Statische Frames - einmal beim Import encodiert
+FRAME_TASK_START = sse({"type": "task_start", "message": "🚀 Starte AI-gestütztes Memory Maintenance..."})
+FRAME_LOADING_DB = sse({"type": "task_progress", "message": "📊 Lade Memory Datenbank...", "progress": 5})
+FRAME_THINKING_CANDIDATES = sse({"type": "thinking", "message": "🤔 Evaluiere STM → LTM Kandidaten..."})
+FRAME_THINKING_SEMANTICS = sse({"type": "thinking", "message": "💭 Analysiere semantische Eigenschaften..."})
+FRAME_CHECK_DUPLICATES = sse({"type": "task_progress", "message": "🔍 Prüfe auf Duplikate...", "progress": 30})
+FRAME_DECIDING = sse({"type": "task_progress", "message": "⚙️ AI trifft Entscheidungen...", "progress": 50})
+FRAME_SLOW_WARNING = sse({"type": "warning", "message": "⏱️ AI arbeitet länger als erwartet..."})
+
+PROGRESS_MESSAGES = [
+    "💡 Reasoning über Memory Importance...",
+    "🎯 Klassifiziere Entry Typen...",
+    "📈 Evaluiere Confidence Scores...",
+    "🔗 Analysiere semantische Verbindungen...",
+    "✨ Optimiere Knowledge Graph...",
+]
+
+# Rotierende Progress-Frames als bytes-Templates - nur progress wird per %d eingesetzt
+PROGRESS_TEMPLATES = [
+    b'data: {"type":"task_progress","message":' + orjson.dumps(msg) + b',"progress":%d}\n\n'
+    for msg in PROGRESS_MESSAGES
+]
+
 
 async def smart_ai_stream(
+    client: httpx.AsyncClient,
     model: str,
     validator_model: str = None,
     tasks: list = None
@@ -25,195 +49,156 @@ async def smart_ai_stream(
     Smart Streaming Proxy:
     - Zeigt sofort Progress
     - Ruft Memory Service im Background
-    - Simuliert AI Thinking mit echten Model-Namen
+    - Zeigt AI Thinking als Heartbeat, bis das Ergebnis da ist
     - Zeigt finale Results
     """
     
     slow_mode = validator_model and validator_model != ""
     
     # Start Event
-    yield 'data: ' + json.dumps({
+    yield sse({
         "type": "started",
         "tasks": tasks or ["dedupe", "promote", "summarize", "graph"],
         "model": model,
         "validator": validator_model,
         "mode": "Slow (Dual Validation)" if slow_mode else "Normal (Fast)"
-    }) + '\n\n'
+    })
     
-    yield 'data: ' + json.dumps({
+    yield sse({
         "type": "info",
         "message": f"🤖 Primary Model: {model}"
-    }) + '\n\n'
+    })
     
     if slow_mode:
-        yield 'data: ' + json.dumps({
+        yield sse({
             "type": "info",
             "message": f"🔍 Validator Model: {validator_model}"
-        }) + '\n\n'
-    
-    # Phase 1: Vorbereitung
-    yield 'data: ' + json.dumps({
-        "type": "task_start",
-        "message": "🚀 Starte AI-gestütztes Memory Maintenance..."
-    }) + '\n\n'
-    
-    await asyncio.sleep(0.3)
-    
-    yield 'data: ' + json.dumps({
-        "type": "task_progress",
-        "message": "📊 Lade Memory Datenbank...",
-        "progress": 5
-    }) + '\n\n'
+        })
     
     # Background: Call Memory Service
-    maintenance_task = None
     result_holder = {"result": None, "error": None}
+    done_evt = asyncio.Event()
     
     async def call_memory_service():
         try:
-            async with httpx.AsyncClient(timeout=180.0) as client:
-                response = await client.post(
-                    f"{MEMORY_SERVICE_URL}/mcp",
-                    headers={
-                        "Content-Type": "application/json",
-                        "Accept": "application/json, text/event-stream"
-                    },
-                    json={
-                        "jsonrpc": "2.0",
-                        "id": 1,
-                        "method": "tools/call",
-                        "params": {
-                            "name": "maintenance_run",
-                            "arguments": {
-                                "model": model,
-                                "validator_model": validator_model or "",
-                                "ollama_url": "http://ollama:11434"
-                            }
+            if client is None:
+                result_holder["error"] = MEM_CLIENT_MISSING
+                return
+            
+            async with client.stream(
+                "POST",
+                "/mcp",
+                headers={
+                    "Content-Type": "application/json",
+                    "Accept": "application/json, text/event-stream"
+                },
+                json={
+                    "jsonrpc": "2.0",
+                    "id": 1,
+                    "method": "tools/call",
+                    "params": {
+                        "name": "maintenance_run",
+                        "arguments": {
+                            "model": model,
+                            "validator_model": validator_model or "",
+                            "ollama_url": "http://ollama:11434"
                         }
                     }
-                )
-                
-                if response.status_code == 200:
-                    data = parse_sse(response.text)
-                    result_holder["result"] = data
-                else:
+                },
+                timeout=180.0
+            ) as response:
+                if response.status_code != 200:
                     result_holder["error"] = f"HTTP {response.status_code}"
-                    
+                    return
+                
+                # Erstes data:-Frame mit Result übernehmen, Rest nicht puffern
+                async for line in response.aiter_lines():
+                    if line.startswith('data: '):
+                        data = orjson.loads(line[6:])
+                        if data and 'result' in data:
+                            result_holder["result"] = data
+                            break
+                
         except Exception as e:
             result_holder["error"] = str(e)
+        finally:
+            done_evt.set()
     
     maintenance_task = asyncio.create_task(call_memory_service())
     
-    await asyncio.sleep(0.5)
-    
-    # Phase 2: AI Analysis
-    yield 'data: ' + json.dumps({
-        "type": "task_progress",
-        "message": f"🧠 {model} analysiert Memory Entries...",
-        "progress": 15
-    }) + '\n\n'
-    
-    await asyncio.sleep(1)
-    
-    yield 'data: ' + json.dumps({
-        "type": "thinking",
-        "message": f"🤔 Evaluiere STM → LTM Kandidaten..."
-    }) + '\n\n'
-    
-    await asyncio.sleep(0.8)
-    
-    yield 'data: ' + json.dumps({
-        "type": "thinking",
-        "message": "💭 Analysiere semantische Eigenschaften..."
-    }) + '\n\n'
-    
-    await asyncio.sleep(0.7)
-    
-    yield 'data: ' + json.dumps({
-        "type": "task_progress",
-        "message": "🔍 Prüfe auf Duplikate...",
-        "progress": 30
-    }) + '\n\n'
-    
-    await asyncio.sleep(0.6)
+    # Phase 1: Vorbereitung
+    yield FRAME_TASK_START
+    yield FRAME_LOADING_DB
     
+    # Phase 2: AI Analysis - Thinking-Frames nur als Heartbeat,
+    # solange der Memory Service noch arbeitet
+    scripted = [
+        sse({
+            "type": "task_progress",
+            "message": f"🧠 {model} analysiert Memory Entries...",
+            "progress": 15
+        }),
+        FRAME_THINKING_CANDIDATES,
+        FRAME_THINKING_SEMANTICS,
+        FRAME_CHECK_DUPLICATES,
+    ]
     if slow_mode:
-        yield 'data: ' + json.dumps({
+        scripted.append(sse({
             "type": "thinking",
             "message": f"🔍 {validator_model} validiert Primary Decisions..."
-        }) + '\n\n'
-        
-        await asyncio.sleep(1.2)
+        }))
+    scripted.append(FRAME_DECIDING)
     
-    yield 'data: ' + json.dumps({
-        "type": "task_progress",
-        "message": "⚙️ AI trifft Entscheidungen...",
-        "progress": 50
-    }) + '\n\n'
-    
-    # Wait for maintenance to complete
-    max_wait = 30  # Max 30 additional progress updates
-    for i in range(max_wait):
-        if maintenance_task.done():
+    beats = 0
+    max_wait = len(scripted) + 30  # Max 30 zusätzliche Progress Updates
+    while not done_evt.is_set() and beats < max_wait:
+        try:
+            await asyncio.wait_for(done_evt.wait(), timeout=HEARTBEAT_INTERVAL)
             break
+        except asyncio.TimeoutError:
+            pass
         
-        progress = 50 + (i * 2)  # 50 → 110
-        if progress > 95:
-            progress = 95
-        
-        messages = [
-            "💡 Reasoning über Memory Importance...",
-            "🎯 Klassifiziere Entry Typen...",
-            "📈 Evaluiere Confidence Scores...",
-            "🔗 Analysiere semantische Verbindungen...",
-            "✨ Optimiere Knowledge Graph...",
-        ]
-        
-        msg = messages[i % len(messages)]
+        if beats < len(scripted):
+            yield scripted[beats]
+        else:
+            i = beats - len(scripted)
+            progress = min(50 + (i * 2), 95)
+            yield PROGRESS_TEMPLATES[i % len(PROGRESS_TEMPLATES)] % progress
         
-        yield 'data: ' + json.dumps({
-            "type": "task_progress",
-            "message": msg,
-            "progress": progress
-        }) + '\n\n'
-        
-        await asyncio.sleep(0.8)
+        beats += 1
     
     # Ensure task is done
-    if not maintenance_task.done():
-        yield 'data: ' + json.dumps({
-            "type": "warning",
-            "message": "⏱️ AI arbeitet länger als erwartet..."
-        }) + '\n\n'
-        
-        await maintenance_task
+    if not done_evt.is_set():
+        yield FRAME_SLOW_WARNING
+    
+    await maintenance_task
     
     # Process Results
     if result_holder["error"]:
-        yield 'data: ' + json.dumps({
+        yield sse({
             "type": "error",
             "message": f"❌ Error: {result_holder['error']}"
-        }) + '\n\n'
+        })
     
     elif result_holder["result"]:
         data = result_holder["result"]
         
         if data.get('result', {}).get('isError'):
             error_text = data['result']['content'][0]['text']
-            yield 'data: ' + json.dumps({
+            yield sse({
                 "type": "error",
                 "message": f"❌ {error_text}"
-            }) + '\n\n'
+            })
         
         elif 'structuredContent' in data.get('result', {}):
             maint_result = data['result']['structuredContent']
             actions = maint_result.get('actions', {})
             
             # Completion
-            yield 'data: ' + json.dumps({
+            yield sse({
                 "type": "completed",
                 "stats": {"actions": actions}
-            }) + '\n\n'
+            })
             
             # Summary
             ai_dec = actions.get('ai_decisions', 0)
@@ -225,20 +210,20 @@ async def smart_ai_stream(
             if conflicts > 0:
                 summary += f", ⚠️ {conflicts} Conflicts (siehe Log)"
             
-            yield 'data: ' + json.dumps({
+            yield sse({
                 "type": "status",
                 "message": summary
-            }) + '\n\n'
+            })
             
             # Conflict log
             if maint_result.get('conflict_log'):
-                yield 'data: ' + json.dumps({
+                yield sse({
                     "type": "warning",
                     "message": f"📝 Conflict Log: {maint_result['conflict_log']}"
-                }) + '\n\n'
+                })
     
     # Stream end
-    yield 'data: ' + json.dumps({"type": "stream_end"}) + '\n\n'
+    yield FRAME_STREAM_END
 
 @router.post("/start-ai")
 async def start_smart_ai_maintenance(request: Request):
@@ -255,7 +240,12 @@ async def start_smart_ai_maintenance(request: Request):
     tasks = body.get('tasks', [])
     
     return StreamingResponse(
-        smart_ai_stream(model=model, validator_model=validator_model, tasks=tasks),
+        smart_ai_stream(
+            client=get_mem_client(request),
+            model=model,
+            validator_model=validator_model,
+            tasks=tasks
+        ),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
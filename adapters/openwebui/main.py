@@ -119,4 +119,4 @@ async def root():
 
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8200, reload=False)
+    uvicorn.run(app, host="0.0.0.0", port=8200, reload=False, loop="uvloop", http="httptools")
@@ -9,4 +9,6 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=False,
+        loop="uvloop",
+        http="httptools",
     )
\ No newline at end of file
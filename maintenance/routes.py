@@ -4,14 +4,15 @@ API Routes für Memory Maintenance.
 """
 
 from fastapi import APIRouter, Request
-from fastapi.responses import JSONResponse, StreamingResponse
-import json
+from fastapi.responses import StreamingResponse
+from utils.responses import ORJSONResponse
+import orjson
 import asyncio
 
 from .worker import get_worker
 from utils.logger import log_info
 
-router = APIRouter(tags=["maintenance"])
+router = APIRouter(tags=["maintenance"], default_response_class=ORJSONResponse)
 
 
 @router.get("/status")
@@ -29,7 +30,7 @@ async def get_status():
     # Hole auch aktuellen Memory-Status
     memory_status = await worker.get_memory_status()
     
-    return JSONResponse({
+    return ORJSONResponse({
         "worker": worker.get_status(),
         "memory": memory_status
     })
@@ -59,13 +60,12 @@ async def start_maintenance(request: Request):
     async def event_stream():
         async for update in worker.run_maintenance(tasks):
             # SSE Format
-            data = json.dumps(update, ensure_ascii=False)
-            yield f"data: {data}\n\n"
+            yield b"data: " + orjson.dumps(update) + b"\n\n"
             
             # Kleine Pause für UI-Updates
             await asyncio.sleep(0.1)
         
-        yield "data: {\"type\": \"stream_end\"}\n\n"
+        yield b"data: {\"type\": \"stream_end\"}\n\n"
     
     return StreamingResponse(
         event_stream(),
@@ -84,7 +84,7 @@ async def cancel_maintenance():
     worker = get_worker()
     worker.cancel()
     
-    return JSONResponse({
+    return ORJSONResponse({
         "success": True,
         "message": "Cancel requested"
     })
@@ -99,6 +99,6 @@ async def get_maintenance_history():
     """
     worker = get_worker()
     
-    return JSONResponse({
-        "last_run": worker.stats.to_dict() if worker.stats.started_at else None
+    return ORJSONResponse({
+        "last_run": worker.stats.to_dict() if worker.stats.started_at_iso else None
     })
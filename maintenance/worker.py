@@ -11,15 +11,93 @@ Führt intelligente Aufräumarbeiten im Memory durch:
 """
 
 import asyncio
+import json
 import httpx
-from typing import Dict, Any, List, Optional, AsyncGenerator
+from typing import Dict, Any, List, Optional, Tuple, AsyncGenerator
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 
 from config import OLLAMA_BASE, THINKING_MODEL
 from utils.logger import log_info, log_error, log_warning
-from mcp.client import call_tool
+from mcp.client_async import async_call_tool
+from utils.rkhash import find_duplicate_groups
+from utils.memo import ResultCache
+from utils.json_parser import extract_first_json
+
+# Max. gleichzeitige MCP-Calls beim Fan-out (schont den Memory-Server)
+MCP_CONCURRENCY = 8
+
+# LLM-Ergebnisse pro (Prompt-Version, Einträge) - bei Prompt-Änderung Version hochzählen
+PROMPT_VERSION_DUPLICATES = "duplicates-v1"
+PROMPT_VERSION_CATEGORIZE = "categorize-v1"
+PROMPT_VERSION_SUMMARY = "summary-v1"
+
+_llm_cache = ResultCache(maxsize=4096)
+
+# memory_all_recent-Limit für den einen Fetch pro Run (Duplikate nutzen alles, Promote/Summary die ersten 100)
+ENTRIES_FETCH_LIMIT = 500
+
+# Zeichen-Budget für die Einträge in einem Prompt (begrenzt die Tokens pro LLM-Call)
+PROMPT_MAX_CHARS = 8192
+
+# Ein Ollama-Client für alle _ai_*-Calls (Keep-Alive statt Verbindungsaufbau pro Call)
+_ollama_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_ollama_client() -> httpx.AsyncClient:
+    """Gibt den geteilten Ollama-Client zurück (erstellt ihn bei Bedarf)."""
+    global _ollama_client
+    if _ollama_client is None or _ollama_client.is_closed:
+        _ollama_client = httpx.AsyncClient(
+            base_url=OLLAMA_BASE,
+            timeout=httpx.Timeout(60.0, connect=5.0),
+            limits=httpx.Limits(max_keepalive_connections=4),
+        )
+    return _ollama_client
+
+
+async def close_ollama_client():
+    """Schließt den geteilten Ollama-Client (App-Shutdown)."""
+    global _ollama_client
+    if _ollama_client is not None:
+        await _ollama_client.aclose()
+        _ollama_client = None
+
+
+async def _ollama_generate(prompt: str, stop_on_json: bool = False) -> Optional[str]:
+    """
+    Streamt /api/generate (NDJSON) und sammelt den Antworttext.
+
+    Mit stop_on_json wird abgebrochen, sobald ein vollständiges JSON-Objekt
+    vorliegt - der Rest der Generierung (Erklärtext o.ä.) wird nicht abgewartet.
+    Gibt None zurück, wenn Ollama nicht mit 200 antwortet.
+    """
+    buf: List[str] = []
+    async with _get_ollama_client().stream(
+        "POST",
+        "/api/generate",
+        json={
+            "model": THINKING_MODEL,
+            "prompt": prompt,
+            "stream": True
+        }
+    ) as response:
+        if response.status_code != 200:
+            return None
+        
+        async for line in response.aiter_lines():
+            if not line:
+                continue
+            chunk = json.loads(line)
+            piece = chunk.get("response", "")
+            buf.append(piece)
+            if chunk.get("done"):
+                break
+            if stop_on_json and "}" in piece and extract_first_json("".join(buf)) is not None:
+                break
+    
+    return "".join(buf)
 
 
 def unwrap_mcp_result(result: Any) -> Any:
@@ -53,6 +131,65 @@ def unwrap_mcp_result(result: Any) -> Any:
     return inner
 
 
+def _unwrap_or_log(result: Any, tool_name: str) -> Any:
+    """unwrap_mcp_result für asyncio.gather(return_exceptions=True) - Exceptions → None."""
+    if isinstance(result, BaseException):
+        log_error(f"[Maintenance] {tool_name} failed: {result}")
+        return None
+    return unwrap_mcp_result(result)
+
+
+def _count_ok(results: List[Any], tool_name: str, errors: List[str]) -> int:
+    """Zählt erfolgreiche Ergebnisse aus _bounded_gather - Fehler werden geloggt und in errors gesammelt."""
+    ok = 0
+    for result in results:
+        result = _unwrap_or_log(result, tool_name)
+        if result is None or (isinstance(result, dict) and "error" in result):
+            errors.append(f"{tool_name}: {result.get('error') if isinstance(result, dict) else 'failed'}")
+            continue
+        ok += 1
+    return ok
+
+
+async def _bounded_gather(calls: List[Any]) -> List[Any]:
+    """Führt MCP-Calls parallel aus, max. MCP_CONCURRENCY gleichzeitig (Exceptions als Ergebnis)."""
+    sem = asyncio.Semaphore(MCP_CONCURRENCY)
+    
+    async def run(coro):
+        async with sem:
+            return await coro
+    
+    return await asyncio.gather(*(run(c) for c in calls), return_exceptions=True)
+
+
+def _format_entries_bounded(
+    entries: List[Dict],
+    max_chars: int = PROMPT_MAX_CHARS,
+    per_entry: int = 200,
+    numbered: bool = True
+) -> str:
+    """
+    Formatiert Einträge für einen Prompt mit festem Zeichen-Budget.
+    
+    Jeder Eintrag wird auf per_entry Zeichen gekürzt, sobald das Budget
+    erschöpft ist, wird abgebrochen. Es fallen nur hintere Einträge weg,
+    die [i]-Indices im Prompt bleiben also gültig.
+    """
+    parts: List[str] = []
+    used = 0
+    
+    for i, e in enumerate(entries):
+        content = e.get('content', '')[:per_entry]
+        line = f"[{i}] {content}" if numbered else content
+        # +1 für den Zeilenumbruch
+        if used + len(line) + 1 > max_chars:
+            break
+        parts.append(line)
+        used += len(line) + 1
+    
+    return "\n".join(parts)
+
+
 class MaintenanceState(str, Enum):
     IDLE = "idle"
     RUNNING = "running"
@@ -61,11 +198,12 @@ class MaintenanceState(str, Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class MaintenanceStats:
     """Statistiken einer Maintenance-Session."""
-    started_at: Optional[datetime] = None
-    completed_at: Optional[datetime] = None
+    # Zeitstempel schon als ISO-String (to_dict() muss nicht serialisieren)
+    started_at_iso: Optional[str] = None
+    completed_at_iso: Optional[str] = None
     
     # Gefundene Items
     stm_entries: int = 0
@@ -86,10 +224,26 @@ class MaintenanceStats:
     # Fehler
     errors: List[str] = field(default_factory=list)
     
+    # to_dict()-Cache: _version wird bei jedem Feld-Write hochgezählt
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+    _cached_version: Optional[Tuple[int, int]] = field(default=None, init=False, repr=False, compare=False)
+    _cached_dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name: str, value: Any):
+        object.__setattr__(self, name, value)
+        if not name.startswith("_"):
+            # während __init__ ist der Slot _version noch nicht belegt
+            object.__setattr__(self, "_version", getattr(self, "_version", 0) + 1)
+    
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+        # errors wird per append() verändert, nicht per Zuweisung → Länge mit in die Version
+        version = (self._version, len(self.errors))
+        if self._cached_dict is not None and self._cached_version == version:
+            return self._cached_dict
+        
+        self._cached_dict = {
+            "started_at": self.started_at_iso,
+            "completed_at": self.completed_at_iso,
             "counts": {
                 "stm_entries": self.stm_entries,
                 "mtm_entries": self.mtm_entries,
@@ -108,6 +262,8 @@ class MaintenanceStats:
             },
             "errors": self.errors,
         }
+        self._cached_version = version
+        return self._cached_dict
 
 
 class MaintenanceWorker:
@@ -124,6 +280,8 @@ class MaintenanceWorker:
         self.current_task = ""
         self.stats = MaintenanceStats()
         self._cancel_requested = False
+        # Einmal pro Run geladene Einträge (memory_all_recent), geteilt von allen Tasks
+        self._run_cache: Optional[List[Dict]] = None
     
     def get_status(self) -> Dict[str, Any]:
         """Aktueller Status für API."""
@@ -143,19 +301,20 @@ class MaintenanceWorker:
     async def get_memory_status(self) -> Dict[str, Any]:
         """Holt aktuellen Memory-Status vom MCP."""
         try:
-            # Alle Conversations listen
-            conv_result = unwrap_mcp_result(call_tool("memory_list_conversations", {
-                "limit": 100
-            }, timeout=10))
+            # Conversations + Graph Stats sind unabhängig → parallel holen
+            conv_result, graph_data = await asyncio.gather(
+                async_call_tool("memory_list_conversations", {"limit": 100}, timeout=10),
+                async_call_tool("memory_graph_stats", {}, timeout=10),
+                return_exceptions=True,
+            )
+            conv_result = _unwrap_or_log(conv_result, "memory_list_conversations")
+            graph_data = _unwrap_or_log(graph_data, "memory_graph_stats")
             
             conversations = conv_result.get("conversations", []) if isinstance(conv_result, dict) else []
             total_entries = sum(c.get("entry_count", 0) for c in conversations)
             
             log_info(f"[Maintenance] Found {len(conversations)} conversations, {total_entries} entries")
             
-            # Graph Stats
-            graph_data = unwrap_mcp_result(call_tool("memory_graph_stats", {}, timeout=10))
-            
             return {
                 "conversations": len(conversations),
                 "stm_entries": total_entries,
@@ -176,6 +335,24 @@ class MaintenanceWorker:
                 "error": str(e)
             }
     
+    async def _load_entries(self) -> List[Dict]:
+        """Lädt memory_all_recent einmal pro Run und legt es in _run_cache ab."""
+        if self._run_cache is None:
+            result = unwrap_mcp_result(await async_call_tool("memory_all_recent", {
+                "limit": ENTRIES_FETCH_LIMIT
+            }, timeout=30))
+            
+            self._run_cache = result.get("entries", []) if isinstance(result, dict) else []
+        
+        return self._run_cache
+    
+    def _forget_entries(self, ids: List[Any]):
+        """Entfernt gelöschte Einträge aus dem Run-Cache, damit spätere Tasks sie nicht mehr sehen."""
+        if self._run_cache is None or not ids:
+            return
+        deleted = set(ids)
+        self._run_cache[:] = [e for e in self._run_cache if e.get("id") not in deleted]
+    
     async def run_maintenance(
         self,
         tasks: List[str] = None
@@ -201,7 +378,8 @@ class MaintenanceWorker:
         self.progress = 0.0
         self._cancel_requested = False
         self.stats = MaintenanceStats()
-        self.stats.started_at = datetime.now()
+        self.stats.started_at_iso = datetime.now().isoformat()
+        self._run_cache = None
         
         yield {"type": "started", "tasks": tasks}
         
@@ -219,6 +397,11 @@ class MaintenanceWorker:
                 "data": status
             }
             
+            # Einträge nur einmal holen, statt pro Task ein eigener memory_all_recent-Call
+            entries: List[Dict] = []
+            if any(t in ("duplicates", "promote", "summarize") for t in tasks):
+                entries = await self._load_entries()
+            
             total_tasks = len(tasks)
             
             for i, task in enumerate(tasks):
@@ -230,17 +413,17 @@ class MaintenanceWorker:
                 base_progress = (i / total_tasks) * 100
                 
                 if task == "duplicates":
-                    async for update in self._find_duplicates():
+                    async for update in self._find_duplicates(entries):
                         update["progress"] = base_progress + (update.get("sub_progress", 0) / total_tasks)
                         yield update
                 
                 elif task == "promote":
-                    async for update in self._promote_entries():
+                    async for update in self._promote_entries(entries[:100]):
                         update["progress"] = base_progress + (update.get("sub_progress", 0) / total_tasks)
                         yield update
                 
                 elif task == "summarize":
-                    async for update in self._create_summaries():
+                    async for update in self._create_summaries(entries[:100]):
                         update["progress"] = base_progress + (update.get("sub_progress", 0) / total_tasks)
                         yield update
                 
@@ -252,7 +435,7 @@ class MaintenanceWorker:
                 self.progress = ((i + 1) / total_tasks) * 100
             
             self.state = MaintenanceState.COMPLETED
-            self.stats.completed_at = datetime.now()
+            self.stats.completed_at_iso = datetime.now().isoformat()
             
             yield {
                 "type": "completed",
@@ -269,18 +452,12 @@ class MaintenanceWorker:
         finally:
             self.current_task = ""
     
-    async def _find_duplicates(self) -> AsyncGenerator[Dict[str, Any], None]:
-        """Findet und merged Duplikate."""
+    async def _find_duplicates(self, entries: List[Dict]) -> AsyncGenerator[Dict[str, Any], None]:
+        """Findet und merged Duplikate (entries = Einträge aus ALLEN Conversations)."""
         self.current_task = "Duplikate suchen..."
         yield {"type": "task_start", "task": "duplicates", "message": "Suche Duplikate..."}
         
         try:
-            # Alle Einträge aus ALLEN Conversations laden
-            all_entries = unwrap_mcp_result(call_tool("memory_all_recent", {
-                "limit": 500
-            }, timeout=30))
-            
-            entries = all_entries.get("entries", []) if isinstance(all_entries, dict) else []
             total = len(entries)
             
             if total == 0:
@@ -289,10 +466,9 @@ class MaintenanceWorker:
             
             yield {"type": "task_progress", "message": f"Analysiere {total} Einträge...", "sub_progress": 10}
             
-            # KI analysieren lassen
             if total > 5:
                 try:
-                    duplicates = await self._ai_find_duplicates(entries[:50])  # Max 50 für KI
+                    duplicates = await self._detect_duplicates(entries)
                     self.stats.duplicates_found = len(duplicates)
                 except Exception as e:
                     log_error(f"AI duplicate check failed: {e}")
@@ -308,11 +484,12 @@ class MaintenanceWorker:
                 log_info(f"[Maintenance] About to merge {len(duplicates)} duplicate groups")
                 log_info(f"[Maintenance] Duplicates data: {duplicates}")
                 
-                # Duplikate TATSÄCHLICH mergen
+                if self._cancel_requested:
+                    return
+                
+                # Duplikate TATSÄCHLICH mergen - IDs aller Gruppen sammeln, ein Bulk-Delete
+                ids_to_delete = []
                 for dup in duplicates:
-                    if self._cancel_requested:
-                        return
-                    
                     try:
                         indices = dup.get("indices", [])
                         log_info(f"[Maintenance] Processing dup with indices: {indices}")
@@ -321,21 +498,27 @@ class MaintenanceWorker:
                             entry_ids = [entries[idx]["id"] for idx in indices if idx < len(entries)]
                             
                             # Keep first, delete rest
-                            ids_to_delete = entry_ids[1:]
-                            
-                            # Delete duplicates
-                            result = unwrap_mcp_result(call_tool("memory_delete_bulk", {
-                                "ids": ids_to_delete
-                            }, timeout=10))
-                            
-                            if isinstance(result, dict):
-                                deleted = result.get("deleted", 0)
-                                self.stats.duplicates_merged += deleted
+                            ids_to_delete.extend(entry_ids[1:])
                     
                     except Exception as e:
                         log_error(f"Failed to merge duplicate: {e}")
                         self.stats.errors.append(f"Merge failed: {e}")
                 
+                if ids_to_delete:
+                    # Überlappende Gruppen → IDs nur einmal löschen
+                    ids_to_delete = list(dict.fromkeys(ids_to_delete))
+                    
+                    result = unwrap_mcp_result(await async_call_tool("memory_delete_bulk", {
+                        "ids": ids_to_delete
+                    }, timeout=30))
+                    
+                    if isinstance(result, dict) and "error" not in result:
+                        self.stats.duplicates_merged += result.get("deleted", 0)
+                        self._forget_entries(ids_to_delete)
+                    else:
+                        log_error(f"[Maintenance] memory_delete_bulk failed: {result}")
+                        self.stats.errors.append(f"Merge failed: {result}")
+                
                 yield {
                     "type": "task_progress",
                     "message": f"{self.stats.duplicates_merged} Duplikate gemerged",
@@ -346,37 +529,71 @@ class MaintenanceWorker:
             
             # BONUS: Graph duplicate merging
             try:
-                graph_dups = unwrap_mcp_result(call_tool("graph_find_duplicate_nodes", {}, timeout=10))
+                graph_dups = unwrap_mcp_result(await async_call_tool("graph_find_duplicate_nodes", {}, timeout=10))
                 
                 if isinstance(graph_dups, dict):
                     dup_groups = graph_dups.get("duplicate_groups", [])
                     
-                    for group in dup_groups:
-                        if self._cancel_requested:
-                            return
-                        
-                        node_ids = group.get("node_ids", [])
-                        if len(node_ids) >= 2:
-                            # Merge graph nodes
-                            unwrap_mcp_result(call_tool("graph_merge_nodes", {
-                                "node_ids": node_ids
-                            }, timeout=10))
+                    if self._cancel_requested:
+                        return
+                    
+                    # Merge graph nodes (parallel)
+                    results = await _bounded_gather([
+                        async_call_tool("graph_merge_nodes", {"node_ids": group["node_ids"]}, timeout=10)
+                        for group in dup_groups
+                        if len(group.get("node_ids", [])) >= 2
+                    ])
+                    merged = _count_ok(results, "graph_merge_nodes", self.stats.errors)
+                    log_info(f"[Maintenance] Graph: {merged}/{len(results)} duplicate groups merged")
             except Exception as e:
                 log_error(f"Graph duplicate merge failed: {e}")
             
         except Exception as e:
             yield {"type": "task_error", "task": "duplicates", "message": str(e)}
 
+    async def _detect_duplicates(self, entries: List[Dict]) -> List[Dict]:
+        """
+        Duplikat-Erkennung in zwei Stufen.
+        
+        1. Rabin-Karp Prefilter: (nahezu) identische Texte, ohne LLM
+        2. KI nur für den Rest (semantische Duplikate), max. 50 Einträge
+        """
+        duplicates = [
+            {"indices": group, "reason": "Rolling-Hash Jaccard > 0.8"}
+            for group in find_duplicate_groups([e.get("content", "") for e in entries])
+        ]
+        
+        grouped = {i for dup in duplicates for i in dup["indices"]}
+        residual = [i for i in range(len(entries)) if i not in grouped][:50]  # Max 50 für KI
+        
+        if len(residual) < 2:
+            return duplicates
+        
+        # KI-Indices beziehen sich auf die Rest-Liste → zurück auf entries mappen
+        for dup in await self._ai_find_duplicates([entries[i] for i in residual]):
+            if not isinstance(dup, dict):
+                continue
+            dup["indices"] = [
+                residual[idx] for idx in dup.get("indices", [])
+                if isinstance(idx, int) and 0 <= idx < len(residual)
+            ]
+            duplicates.append(dup)
+        
+        return duplicates
+    
     async def _ai_find_duplicates(self, entries: List[Dict]) -> List[Dict]:
         """Lässt KI Duplikate identifizieren."""
         if not entries:
             return []
         
+        cache_key = ResultCache.make_key(PROMPT_VERSION_DUPLICATES, [e.get('content', '')[:200] for e in entries])
+        cached = _llm_cache.get(cache_key)
+        if cached is not None:
+            log_info("[Maintenance] AI duplicate check: cache hit")
+            return cached
+        
         # Entries für Prompt formatieren
-        entries_text = "\n".join([
-            f"[{i}] {e.get('content', '')[:200]}"
-            for i, e in enumerate(entries)
-        ])
+        entries_text = _format_entries_bounded(entries)
         
         prompt = f"""Analysiere diese Memory-Einträge und finde DUPLIKATE oder SEHR ÄHNLICHE Inhalte.
 
@@ -394,28 +611,13 @@ Antworte NUR mit JSON - keine Erklärung:
 Wenn keine Duplikate: {{"duplicates": []}}"""
 
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    f"{OLLAMA_BASE}/api/generate",
-                    json={
-                        "model": THINKING_MODEL,
-                        "prompt": prompt,
-                        "stream": False
-                    }
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    text = result.get("response", "")
-                    
-                    # JSON extrahieren
-                    import json
-                    import re
-                    
-                    match = re.search(r'\{[\s\S]*\}', text)
-                    if match:
-                        data = json.loads(match.group())
-                        return data.get("duplicates", [])
+            text = await _ollama_generate(prompt, stop_on_json=True)
+            
+            data = extract_first_json(text) if text is not None else None
+            if data is not None:
+                duplicates = data.get("duplicates", [])
+                _llm_cache.set(cache_key, duplicates)
+                return duplicates
             
             return []
             
@@ -423,19 +625,12 @@ Wenn keine Duplikate: {{"duplicates": []}}"""
             log_error(f"[Maintenance] AI duplicate check failed: {e}")
             return []
     
-    async def _promote_entries(self) -> AsyncGenerator[Dict[str, Any], None]:
+    async def _promote_entries(self, entries: List[Dict]) -> AsyncGenerator[Dict[str, Any], None]:
         """Promotet wichtige STM-Einträge zu MTM/LTM."""
         self.current_task = "Einträge kategorisieren..."
         yield {"type": "task_start", "task": "promote", "message": "Analysiere wichtige Einträge..."}
         
         try:
-            # Alle STM Einträge aus ALLEN Conversations
-            stm_entries = unwrap_mcp_result(call_tool("memory_all_recent", {
-                "limit": 100
-            }, timeout=30))
-            
-            entries = stm_entries.get("entries", []) if isinstance(stm_entries, dict) else []
-            
             if not entries:
                 yield {"type": "task_progress", "message": "Keine STM-Einträge", "sub_progress": 100}
                 return
@@ -450,20 +645,29 @@ Wenn keine Duplikate: {{"duplicates": []}}"""
                 promotions = {"to_ltm": [], "to_delete": []}
                 self.stats.errors.append(f"Categorize: {e}")
             
-            # Promote to LTM
+            if self._cancel_requested:
+                return
+            
+            # Promote to LTM - alle Fakten in einem Bulk-Call speichern
+            facts = []
             for promo in promotions.get("to_ltm", []):
-                if self._cancel_requested:
-                    return
-                
-                # Als Fakt speichern
                 entry = entries[promo["index"]] if promo["index"] < len(entries) else None
                 if entry:
-                    call_tool("memory_fact_save", {
+                    facts.append({
                         "conversation_id": "global",
                         "key": promo.get("key", f"fact_{promo['index']}"),
                         "value": entry.get("content", "")[:500]
-                    }, timeout=10)
-                    self.stats.promoted_to_ltm += 1
+                    })
+            
+            if facts:
+                result = unwrap_mcp_result(await async_call_tool("memory_fact_save_bulk", {
+                    "facts": facts
+                }, timeout=30))
+                
+                if isinstance(result, dict):
+                    self.stats.promoted_to_ltm += result.get("saved", 0)
+                    for err in result.get("errors", []):
+                        self.stats.errors.append(f"Promote failed: {err}")
             
             # DELETE unwanted entries
             to_delete_indices = promotions.get("to_delete", [])
@@ -473,13 +677,17 @@ Wenn keine Duplikate: {{"duplicates": []}}"""
                     ids_to_delete = [entries[idx]["id"] for idx in to_delete_indices if idx < len(entries)]
                     
                     # Delete them
-                    result = unwrap_mcp_result(call_tool("memory_delete_bulk", {
+                    result = unwrap_mcp_result(await async_call_tool("memory_delete_bulk", {
                         "ids": ids_to_delete
                     }, timeout=10))
                     
-                    if isinstance(result, dict):
+                    if isinstance(result, dict) and "error" not in result:
                         deleted = result.get("deleted", 0)
                         self.stats.entries_deleted += deleted
+                        self._forget_entries(ids_to_delete)
+                    else:
+                        log_error(f"[Maintenance] memory_delete_bulk failed: {result}")
+                        self.stats.errors.append(f"Delete failed: {result}")
                 
                 except Exception as e:
                     log_error(f"Failed to delete entries: {e}")
@@ -499,10 +707,13 @@ Wenn keine Duplikate: {{"duplicates": []}}"""
         if not entries:
             return {"to_ltm": [], "to_delete": []}
         
-        entries_text = "\n".join([
-            f"[{i}] {e.get('content', '')[:150]}"
-            for i, e in enumerate(entries)
-        ])
+        cache_key = ResultCache.make_key(PROMPT_VERSION_CATEGORIZE, [e.get('content', '')[:150] for e in entries])
+        cached = _llm_cache.get(cache_key)
+        if cached is not None:
+            log_info("[Maintenance] AI categorize: cache hit")
+            return cached
+        
+        entries_text = _format_entries_bounded(entries, per_entry=150)
         
         prompt = f"""Analysiere diese Gesprächs-Einträge und kategorisiere sie:
 
@@ -522,26 +733,12 @@ Antworte NUR mit JSON:
 }}"""
 
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    f"{OLLAMA_BASE}/api/generate",
-                    json={
-                        "model": THINKING_MODEL,
-                        "prompt": prompt,
-                        "stream": False
-                    }
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    text = result.get("response", "")
-                    
-                    import json
-                    import re
-                    
-                    match = re.search(r'\{[\s\S]*\}', text)
-                    if match:
-                        return json.loads(match.group())
+            text = await _ollama_generate(prompt, stop_on_json=True)
+            
+            promotions = extract_first_json(text) if text is not None else None
+            if promotions is not None:
+                _llm_cache.set(cache_key, promotions)
+                return promotions
             
             return {"to_ltm": [], "to_delete": []}
             
@@ -549,19 +746,12 @@ Antworte NUR mit JSON:
             log_error(f"[Maintenance] AI categorize failed: {e}")
             return {"to_ltm": [], "to_delete": []}
     
-    async def _create_summaries(self) -> AsyncGenerator[Dict[str, Any], None]:
+    async def _create_summaries(self, entries: List[Dict]) -> AsyncGenerator[Dict[str, Any], None]:
         """Erstellt Zusammenfassungen von alten Einträgen."""
         self.current_task = "Zusammenfassungen erstellen..."
         yield {"type": "task_start", "task": "summarize", "message": "Erstelle Zusammenfassungen..."}
         
         try:
-            # Alte Einträge aus ALLEN Conversations laden
-            old_entries = unwrap_mcp_result(call_tool("memory_all_recent", {
-                "limit": 100
-            }, timeout=30))
-            
-            entries = old_entries.get("entries", []) if isinstance(old_entries, dict) else []
-            
             if len(entries) < 10:
                 yield {"type": "task_progress", "message": "Zu wenig Einträge für Zusammenfassung", "sub_progress": 100}
                 return
@@ -578,7 +768,7 @@ Antworte NUR mit JSON:
             
             if summary:
                 # Summary speichern
-                call_tool("memory_fact_save", {
+                await async_call_tool("memory_fact_save", {
                     "conversation_id": "system",
                     "key": f"conversation_summary_{datetime.now().strftime('%Y%m%d')}",
                     "value": summary
@@ -601,10 +791,13 @@ Antworte NUR mit JSON:
         if not entries:
             return None
         
-        entries_text = "\n".join([
-            e.get('content', '')[:200]
-            for e in entries
-        ])
+        cache_key = ResultCache.make_key(PROMPT_VERSION_SUMMARY, [e.get('content', '')[:200] for e in entries])
+        cached = _llm_cache.get(cache_key)
+        if cached is not None:
+            log_info("[Maintenance] AI summary: cache hit")
+            return cached
+        
+        entries_text = _format_entries_bounded(entries, numbered=False)
         
         prompt = f"""Erstelle eine KURZE Zusammenfassung dieser Konversationen.
 Fokussiere auf: Wichtige Fakten über den User, besprochene Themen, getroffene Entscheidungen.
@@ -615,19 +808,13 @@ Konversationen:
 Zusammenfassung (max 500 Zeichen):"""
 
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    f"{OLLAMA_BASE}/api/generate",
-                    json={
-                        "model": THINKING_MODEL,
-                        "prompt": prompt,
-                        "stream": False
-                    }
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    return result.get("response", "")[:500]
+            text = await _ollama_generate(prompt)
+            
+            if text is not None:
+                summary = text[:500]
+                if summary:
+                    _llm_cache.set(cache_key, summary)
+                return summary
             
             return None
             
@@ -641,8 +828,13 @@ Zusammenfassung (max 500 Zeichen):"""
         yield {"type": "task_start", "task": "graph", "message": "Optimiere Knowledge Graph..."}
         
         try:
-            # Graph-Statistiken mit dediziertem Tool
-            graph_stats = unwrap_mcp_result(call_tool("memory_graph_stats", {}, timeout=10))
+            # Graph-Statistiken + Duplikat-Suche sind unabhängig → parallel
+            graph_stats, duplicates = await asyncio.gather(
+                async_call_tool("memory_graph_stats", {}, timeout=10),
+                async_call_tool("graph_find_duplicate_nodes", {}, timeout=10),
+                return_exceptions=True,
+            )
+            graph_stats = _unwrap_or_log(graph_stats, "memory_graph_stats")
             
             nodes = graph_stats.get("nodes", 0) if isinstance(graph_stats, dict) else 0
             edges = graph_stats.get("edges", 0) if isinstance(graph_stats, dict) else 0
@@ -653,9 +845,11 @@ Zusammenfassung (max 500 Zeichen):"""
                 "sub_progress": 20
             }
             
-            # 1. Find and merge duplicate nodes
+            # 1. Merge duplicate nodes
             try:
-                duplicates = unwrap_mcp_result(call_tool("graph_find_duplicate_nodes", {}, timeout=10))
+                if isinstance(duplicates, BaseException):
+                    raise duplicates
+                duplicates = unwrap_mcp_result(duplicates)
                 
                 if isinstance(duplicates, dict):
                     dup_groups = duplicates.get("duplicate_groups", [])
@@ -666,24 +860,38 @@ Zusammenfassung (max 500 Zeichen):"""
                         "sub_progress": 40
                     }
                     
-                    for group in dup_groups:
-                        if self._cancel_requested:
-                            return
-                        
-                        node_ids = group.get("node_ids", [])
-                        if len(node_ids) >= 2:
-                            # Merge nodes
-                            unwrap_mcp_result(call_tool("graph_merge_nodes", {
-                                "node_ids": node_ids
-                            }, timeout=10))
+                    if self._cancel_requested:
+                        return
+                    
+                    # Merge nodes (parallel)
+                    results = await _bounded_gather([
+                        async_call_tool("graph_merge_nodes", {"node_ids": group["node_ids"]}, timeout=10)
+                        for group in dup_groups
+                        if len(group.get("node_ids", [])) >= 2
+                    ])
+                    merged = _count_ok(results, "graph_merge_nodes", self.stats.errors)
+                    
+                    yield {
+                        "type": "task_progress",
+                        "message": f"{merged}/{len(results)} Duplikat-Gruppen gemerged",
+                        "sub_progress": 50
+                    }
             
             except Exception as e:
                 log_error(f"Graph duplicate merge failed: {e}")
                 self.stats.errors.append(f"Graph merge: {e}")
             
-            # 2. Delete orphaned nodes
+            # 2. + 3. Orphans löschen und schwache Edges prunen - unabhängig voneinander
+            orphans, pruned = await asyncio.gather(
+                async_call_tool("graph_delete_orphan_nodes", {}, timeout=10),
+                async_call_tool("graph_prune_weak_edges", {"threshold": 0.3}, timeout=10),
+                return_exceptions=True,
+            )
+            
             try:
-                orphans = unwrap_mcp_result(call_tool("graph_delete_orphan_nodes", {}, timeout=10))
+                if isinstance(orphans, BaseException):
+                    raise orphans
+                orphans = unwrap_mcp_result(orphans)
                 
                 if isinstance(orphans, dict):
                     deleted = orphans.get("deleted", 0)
@@ -698,11 +906,10 @@ Zusammenfassung (max 500 Zeichen):"""
                 log_error(f"Orphan deletion failed: {e}")
                 self.stats.errors.append(f"Orphan delete: {e}")
             
-            # 3. Prune weak edges
             try:
-                pruned = unwrap_mcp_result(call_tool("graph_prune_weak_edges", {
-                    "threshold": 0.3
-                }, timeout=10))
+                if isinstance(pruned, BaseException):
+                    raise pruned
+                pruned = unwrap_mcp_result(pruned)
                 
                 if isinstance(pruned, dict):
                     count = pruned.get("pruned", 0)
@@ -719,7 +926,7 @@ Zusammenfassung (max 500 Zeichen):"""
                 self.stats.errors.append(f"Edge prune: {e}")
             
             # Final stats
-            final_stats = unwrap_mcp_result(call_tool("memory_graph_stats", {}, timeout=10))
+            final_stats = unwrap_mcp_result(await async_call_tool("memory_graph_stats", {}, timeout=10))
             final_nodes = final_stats.get("nodes", 0) if isinstance(final_stats, dict) else 0
             final_edges = final_stats.get("edges", 0) if isinstance(final_stats, dict) else 0
             
@@ -0,0 +1,134 @@
+# mcp/client_async.py
+"""
+Async MCP-Client für den Maintenance-Worker.
+
+Gleiche Reihenfolge wie mcp.client.call_tool: zuerst der Hub (alle
+registrierten MCPs), im Threadpool statt blockierend im Event-Loop.
+Nur wenn der Hub nicht verfügbar ist, geht der Call direkt an den
+SQL-Memory-MCP aus der Registry - über einen geteilten httpx.AsyncClient.
+"""
+
+import json
+from typing import Any, Dict, Optional
+
+import httpx
+from starlette.concurrency import run_in_threadpool
+
+from mcp_registry import MCPS
+from utils.logger import log_debug, log_error
+
+# Fallback-Ziel: dieselbe URL, die der Hub für sql-memory nutzt (inkl. /mcp)
+FALLBACK_URL = MCPS["sql-memory"]["url"]
+
+_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "application/json, text/event-stream",
+}
+
+# Ein Client pro Prozess (Keep-Alive Pool), lazy erstellt
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Gibt den geteilten AsyncClient zurück (erstellt ihn bei Bedarf)."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            timeout=10.0,
+        )
+    return _client
+
+
+async def close_async_client():
+    """Schließt den geteilten Client (App-Shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+async def async_call_tool(name: str, arguments: Dict[str, Any], timeout: int = 5) -> Optional[Dict[str, Any]]:
+    """
+    Ruft ein MCP-Tool auf.
+    
+    Versucht zuerst den Hub (für alle registrierten MCPs), fällt zurück
+    auf einen direkten Call an den SQL-Memory-MCP wenn der Hub nicht
+    verfügbar ist. Rückgabe-Format wie mcp.client.call_tool.
+    """
+    # Versuche Hub (aggregiert alle MCPs) - call_tool blockiert → Threadpool
+    try:
+        from mcp.hub import get_hub
+        hub = get_hub()
+        result = await run_in_threadpool(hub.call_tool, name, arguments)
+        
+        # Wrap result in standard format
+        if result and not isinstance(result, dict):
+            result = {"result": result}
+        elif result and "error" not in result:
+            result = {"result": result}
+        
+        return result
+        
+    except Exception as e:
+        log_debug(f"[MCP-Async] Hub not available, falling back to direct call: {e}")
+    
+    return await _call_direct(name, arguments, timeout)
+
+
+async def _call_direct(name: str, arguments: Dict[str, Any], timeout: int) -> Optional[Dict[str, Any]]:
+    """
+    JSON-RPC tools/call direkt an FALLBACK_URL.
+    
+    Gibt wie mcp.client._call_mcp_raw das JSON-RPC-Objekt zurück
+    (bei SSE das letzte data:-Frame), bei Fehlern None.
+    """
+    payload = {
+        "jsonrpc": "2.0",
+        "id": f"call-{name}",
+        "method": "tools/call",
+        "params": {
+            "name": name,
+            "arguments": arguments,
+        },
+    }
+
+    log_debug(f"[MCP-Async] → {FALLBACK_URL} tool={name}")
+
+    try:
+        async with get_async_client().stream(
+            "POST",
+            FALLBACK_URL,
+            json=payload,
+            headers=_HEADERS,
+            timeout=timeout,
+        ) as r:
+            if r.status_code >= 400:
+                body = (await r.aread())[:200]
+                log_error(f"[MCP-Async] HTTP {r.status_code} ({name}): {body!r}")
+                return None
+
+            ct = r.headers.get("content-type", "")
+
+            # SSE Mode - zeilenweise lesen, letztes data:-Frame gewinnt
+            if "text/event-stream" in ct:
+                last = None
+                async for line in r.aiter_lines():
+                    if line.startswith("data: "):
+                        try:
+                            last = json.loads(line[6:])
+                        except Exception:
+                            continue
+                return last
+
+            body = await r.aread()
+    except Exception as e:
+        log_error(f"[MCP-Async] Request-Fehler ({name}): {e}")
+        return None
+
+    # Normal JSON
+    try:
+        return json.loads(body)
+    except Exception as e:
+        log_error(f"[MCP-Async] JSON-Parse Fehler ({name}): {e}")
+        return None
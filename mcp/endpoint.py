@@ -10,14 +10,16 @@ Und sieht alle Tools von allen MCPs als eine Liste.
 """
 
 from fastapi import APIRouter, Request
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import StreamingResponse
+from utils.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
 import json
 from typing import Dict, Any
 
 from mcp.hub import get_hub
 from utils.logger import log_info, log_error, log_debug
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 @router.post("/mcp")
@@ -44,7 +46,7 @@ async def mcp_handler(request: Request):
         # INITIALIZE
         # ─────────────────────────────────────────────────────────────
         if method == "initialize":
-            return JSONResponse({
+            return ORJSONResponse({
                 "jsonrpc": "2.0",
                 "id": request_id,
                 "result": {
@@ -67,7 +69,7 @@ async def mcp_handler(request: Request):
             
             log_info(f"[MCP-Endpoint] tools/list → {len(tools)} tools")
             
-            return JSONResponse({
+            return ORJSONResponse({
                 "jsonrpc": "2.0",
                 "id": request_id,
                 "result": {
@@ -83,7 +85,7 @@ async def mcp_handler(request: Request):
             arguments = params.get("arguments", {})
             
             if not tool_name:
-                return JSONResponse({
+                return ORJSONResponse({
                     "jsonrpc": "2.0",
                     "id": request_id,
                     "error": {
@@ -94,11 +96,12 @@ async def mcp_handler(request: Request):
             
             log_info(f"[MCP-Endpoint] tools/call → {tool_name}")
             
-            result = hub.call_tool(tool_name, arguments)
+            # call_tool ist blocking (HTTP/STDIO zum Backend-MCP) → Threadpool
+            result = await run_in_threadpool(hub.call_tool, tool_name, arguments)
             
             # Check for error
             if isinstance(result, dict) and "error" in result:
-                return JSONResponse({
+                return ORJSONResponse({
                     "jsonrpc": "2.0",
                     "id": request_id,
                     "error": {
@@ -107,7 +110,7 @@ async def mcp_handler(request: Request):
                     }
                 })
             
-            return JSONResponse({
+            return ORJSONResponse({
                 "jsonrpc": "2.0",
                 "id": request_id,
                 "result": result
@@ -118,7 +121,7 @@ async def mcp_handler(request: Request):
         # ─────────────────────────────────────────────────────────────
         else:
             log_error(f"[MCP-Endpoint] Unknown method: {method}")
-            return JSONResponse({
+            return ORJSONResponse({
                 "jsonrpc": "2.0",
                 "id": request_id,
                 "error": {
@@ -129,7 +132,7 @@ async def mcp_handler(request: Request):
             
     except Exception as e:
         log_error(f"[MCP-Endpoint] Error: {e}")
-        return JSONResponse({
+        return ORJSONResponse({
             "jsonrpc": "2.0",
             "id": 1,
             "error": {
@@ -147,18 +150,23 @@ async def mcp_handler(request: Request):
 async def mcp_status():
     """Status aller MCPs."""
     hub = get_hub()
-    return JSONResponse({
+    return ORJSONResponse({
         "mcps": hub.list_mcps(),
         "total_tools": len(hub.list_tools())
     })
 
 
 @router.post("/mcp/refresh")
-async def mcp_refresh():
-    """Aktualisiert Tool-Liste von allen MCPs."""
+def mcp_refresh():
+    """
+    Aktualisiert Tool-Liste von allen MCPs.
+    
+    Bewusst sync: refresh() fragt alle MCPs blocking ab,
+    FastAPI führt den Handler dann im Threadpool aus.
+    """
     hub = get_hub()
     hub.refresh()
-    return JSONResponse({
+    return ORJSONResponse({
         "status": "ok",
         "total_tools": len(hub.list_tools())
     })
@@ -180,7 +188,7 @@ async def mcp_tools():
             by_mcp[mcp_name] = []
         by_mcp[mcp_name].append(tool)
     
-    return JSONResponse({
+    return ORJSONResponse({
         "total": len(tools),
         "by_mcp": by_mcp
     })
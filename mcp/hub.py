@@ -9,6 +9,7 @@ Funktionen:
 - AUTO-REGISTRATION: Speichert Tool-Infos automatisch im Knowledge Graph
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
 from mcp_registry import MCPS, get_enabled_mcps
 from mcp.transports import HTTPTransport, SSETransport, STDIOTransport
@@ -389,9 +390,16 @@ class MCPHub:
     
     def shutdown(self):
         """Beendet alle STDIO-Transports."""
-        for mcp_name, transport in self._transports.items():
-            if isinstance(transport, STDIOTransport):
-                transport.shutdown()
+        stdio_transports = [
+            t for t in self._transports.values() if isinstance(t, STDIOTransport)
+        ]
+        
+        # Parallel beenden: jeder Prozess wartet bis zu 5s auf terminate(),
+        # so bleibt es insgesamt bei einem 5s-Fenster statt N × 5s
+        if stdio_transports:
+            with ThreadPoolExecutor(max_workers=len(stdio_transports)) as pool:
+                list(pool.map(lambda t: t.shutdown(), stdio_transports))
+        
         log_info("[MCPHub] Shutdown complete")
 
 
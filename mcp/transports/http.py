@@ -11,7 +11,9 @@ Handhabt Sessions automatisch wenn nötig.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
+import threading
 import uuid
 from typing import Dict, Any, List, Optional
 from utils.logger import log_info, log_error, log_debug, log_warning
@@ -42,6 +44,14 @@ class HTTPTransport:
         self._format: Optional[str] = None
         self._session_id: Optional[str] = None
         self._format_detected = False
+        # Format/Session-State wird aus mehreren Threadpool-Threads gelesen und gesetzt
+        self._state_lock = threading.RLock()
+        
+        # Eine Session pro Transport: Keep-Alive statt neuem TCP-Handshake pro Call
+        self._http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self._http.mount("http://", adapter)
+        self._http.mount("https://", adapter)
     
     # ═══════════════════════════════════════════════════════════════
     # HEADER BUILDERS
@@ -90,7 +100,7 @@ class HTTPTransport:
         }
         
         try:
-            resp = requests.post(
+            resp = self._http.post(
                 self.url,
                 json=payload,
                 headers=self._get_base_headers(),
@@ -174,7 +184,7 @@ class HTTPTransport:
         }
         
         try:
-            resp = requests.post(
+            resp = self._http.post(
                 self.url,
                 json=payload,
                 headers=self._get_base_headers(),
@@ -278,21 +288,24 @@ class HTTPTransport:
         - Initialisiert Session wenn nötig
         - Retry bei Session-Fehlern
         """
-        # Format erkennen
-        if not self._format_detected:
-            self._detect_format()
-        
-        # Session sicherstellen
-        if not self._ensure_session():
-            log_error(f"[HTTP] Could not establish session")
-            return {"error": "Session initialization failed"}
+        # Format erkennen + Session sicherstellen (einmalig, nicht parallel)
+        with self._state_lock:
+            if not self._format_detected:
+                self._detect_format()
+            
+            if not self._ensure_session():
+                log_error(f"[HTTP] Could not establish session")
+                return {"error": "Session initialization failed"}
+            
+            session_id = self._session_id
+            headers = self._get_headers_with_session()
         
-        # Request senden
+        # Request senden (parallel erlaubt, der Connection-Pool ist thread-safe)
         try:
-            resp = requests.post(
+            resp = self._http.post(
                 self.url,
                 json=payload,
-                headers=self._get_headers_with_session(),
+                headers=headers,
                 timeout=self.timeout,
                 stream=True
             )
@@ -305,8 +318,11 @@ class HTTPTransport:
                     
                     if "session" in error_msg.lower():
                         log_warning(f"[HTTP] Session error, reinitializing...")
-                        self._session_id = None
-                        self._format = self.FORMAT_STREAMABLE
+                        with self._state_lock:
+                            # Nur zurücksetzen, wenn kein anderer Thread schon neu initialisiert hat
+                            if self._session_id == session_id:
+                                self._session_id = None
+                            self._format = self.FORMAT_STREAMABLE
                         return self._smart_request(payload, retry_count + 1)
                 except:
                     pass
@@ -381,12 +397,14 @@ class HTTPTransport:
     
     def get_format(self) -> str:
         """Gibt erkanntes Format zurück."""
-        if not self._format_detected:
-            self._detect_format()
-        return self._format or self.FORMAT_UNKNOWN
+        with self._state_lock:
+            if not self._format_detected:
+                self._detect_format()
+            return self._format or self.FORMAT_UNKNOWN
     
     def reset(self):
         """Reset für neuen Detection-Versuch."""
-        self._format = None
-        self._session_id = None
-        self._format_detected = False
+        with self._state_lock:
+            self._format = None
+            self._session_id = None
+            self._format_detected = False
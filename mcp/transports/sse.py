@@ -5,6 +5,7 @@ Für Streaming/Realtime MCPs.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 from typing import Dict, Any, List, Generator
 from utils.logger import log_info, log_error, log_debug
@@ -17,6 +18,12 @@ class SSETransport:
         self.url = url
         self.api_key = api_key
         self.timeout = timeout
+        
+        # Eine Session pro Transport: Keep-Alive statt neuem TCP-Handshake pro Call
+        self._http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self._http.mount("http://", adapter)
+        self._http.mount("https://", adapter)
     
     def _get_headers(self) -> Dict[str, str]:
         """Baut HTTP Headers."""
@@ -41,7 +48,7 @@ class SSETransport:
             log_debug(f"[SSE] tools/list → {self.url}")
             
             # Für list_tools nutzen wir normales HTTP
-            resp = requests.post(
+            resp = self._http.post(
                 self.url,
                 json=payload,
                 headers={"Content-Type": "application/json"},
@@ -81,7 +88,7 @@ class SSETransport:
             
             result_data = None
             
-            with requests.post(
+            with self._http.post(
                 self.url,
                 json=payload,
                 headers=self._get_headers(),
@@ -129,7 +136,7 @@ class SSETransport:
             
             log_debug(f"[SSE] tools/call (stream) {tool_name} → {self.url}")
             
-            with requests.post(
+            with self._http.post(
                 self.url,
                 json=payload,
                 headers=self._get_headers(),
@@ -4,10 +4,12 @@ STDIO Transport für lokale MCP-Prozesse.
 Kommuniziert via stdin/stdout mit einem Subprocess.
 """
 
+import itertools
 import subprocess
 import json
 import threading
 import queue
+import time
 from typing import Dict, Any, List, Optional
 from utils.logger import log_info, log_error, log_debug
 
@@ -22,6 +24,9 @@ class STDIOTransport:
         self._response_queue = queue.Queue()
         self._reader_thread: Optional[threading.Thread] = None
         self._running = False
+        # Ein Prozess, ein stdin/stdout: Start und Request/Response nie parallel
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
     
     def _start_process(self):
         """Startet den MCP-Prozess."""
@@ -68,18 +73,38 @@ class STDIOTransport:
                 break
     
     def _send_request(self, payload: Dict) -> Dict:
-        """Sendet Request und wartet auf Response."""
+        """
+        Sendet Request und wartet auf Response.
+        
+        Läuft unter self._lock (Aufrufer kommen aus dem Threadpool). Jeder
+        Request bekommt eine eigene ID - verspätete Antworten auf einen
+        Request nach Timeout werden verworfen statt dem nächsten zugeordnet.
+        """
+        with self._lock:
+            return self._send_request_locked(payload)
+    
+    def _send_request_locked(self, payload: Dict) -> Dict:
         self._start_process()
         
+        request_id = next(self._ids)
+        payload = {**payload, "id": request_id}
+        
         try:
             # Request senden
             request_str = json.dumps(payload) + "\n"
             self.process.stdin.write(request_str)
             self.process.stdin.flush()
             
-            # Auf Response warten
-            response = self._response_queue.get(timeout=self.timeout)
-            return response
+            # Auf Response mit passender ID warten
+            deadline = time.monotonic() + self.timeout
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise queue.Empty
+                response = self._response_queue.get(timeout=remaining)
+                if isinstance(response, dict) and response.get("id") == request_id:
+                    return response
+                log_debug(f"[STDIO] Discarding unmatched response: {str(response)[:80]}")
             
         except queue.Empty:
             log_error(f"[STDIO] Timeout waiting for response")
@@ -93,7 +118,6 @@ class STDIOTransport:
         try:
             payload = {
                 "jsonrpc": "2.0",
-                "id": 1,
                 "method": "tools/list",
                 "params": {}
             }
@@ -120,7 +144,6 @@ class STDIOTransport:
         try:
             payload = {
                 "jsonrpc": "2.0",
-                "id": 1,
                 "method": "tools/call",
                 "params": {
                     "name": tool_name,
@@ -144,20 +167,22 @@ class STDIOTransport:
     def health_check(self) -> bool:
         """Prüft ob MCP läuft."""
         try:
-            if self.process is None:
-                self._start_process()
-            return self.process is not None and self.process.poll() is None
+            with self._lock:
+                if self.process is None:
+                    self._start_process()
+                return self.process is not None and self.process.poll() is None
         except:
             return False
     
     def shutdown(self):
         """Beendet den Prozess."""
-        self._running = False
-        if self.process:
-            self.process.terminate()
-            try:
-                self.process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                self.process.kill()
-            self.process = None
-            log_info("[STDIO] Process terminated")
+        with self._lock:
+            self._running = False
+            if self.process:
+                self.process.terminate()
+                try:
+                    self.process.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    self.process.kill()
+                self.process = None
+                log_info("[STDIO] Process terminated")
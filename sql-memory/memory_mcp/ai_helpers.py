@@ -3,14 +3,120 @@ AI Helper Functions für Memory Maintenance
 Kommuniziert mit Ollama für intelligentes Sorting
 """
 
-import json
+import atexit
+import hashlib
+import orjson
+import re
 import requests
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Optional, List
+from requests.adapters import HTTPAdapter
+from typing import Dict, Optional, List, Tuple
+from urllib3.util.retry import Retry
 import os
 
+# Wie lange Ollama das Model nach einem Call im Speicher hält (kein Reload zwischen Batches)
+OLLAMA_KEEP_ALIVE = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
 
-def call_ollama(model: str, prompt: str, ollama_url: str = "http://ollama:11434") -> Dict:
+# Ab dieser Primary-Confidence wird im Slow Mode nicht mehr validiert
+VALIDATION_CONFIDENCE_THRESHOLD = 85
+
+# Token-Limit für die Antwort: ein kleines JSON-Objekt (decision/confidence/reasoning),
+# etwas Luft für reasoning; im Batch-Prompt ein Objekt pro Entry
+NUM_PREDICT_SINGLE = 96
+NUM_PREDICT_PER_ENTRY = 80
+
+# Max. parallele Ollama-Requests pro Batch (Ollama queued den Rest serverseitig)
+OLLAMA_CONCURRENCY = 8
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Eine Session pro Prozess - Keep-Alive statt TCP-Handshake pro Entry
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """Gibt die geteilte Ollama-Session zurück (erstellt sie bei Bedarf)."""
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=16,
+                    pool_maxsize=32,
+                    max_retries=Retry(total=2, backoff_factor=0.2)
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _SESSION = session
+    return _SESSION
+
+
+@atexit.register
+def _close_session():
+    if _SESSION is not None:
+        _SESSION.close()
+
+
+# Response-Cache: gleiche (Model, Prompt) → gleiche Antwort (temperature 0, Prompts deterministisch)
+RESPONSE_CACHE_SIZE = 4096
+RESPONSE_CACHE_TTL = 3600  # Sekunden
+
+_response_cache: "OrderedDict[bytes, Tuple[float, str]]" = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+# Laufende Requests pro Cache-Key: identische Prompts warten auf denselben Call
+_inflight: Dict[bytes, Future] = {}
+
+
+def _cache_key(
+    model: str,
+    prompt: str,
+    num_predict: Optional[int],
+    stop_after_decision: bool = False,
+    json_format: bool = False
+) -> bytes:
+    # Ohne URL: bei mehreren Backends liefert jedes dasselbe Model
+    flags = f"{num_predict}\0{stop_after_decision:d}{json_format:d}"
+    return hashlib.sha256(f"{model}\0{flags}\0{prompt}".encode("utf-8")).digest()
+
+
+def _cache_lookup(key: bytes) -> Optional[str]:
+    """Cache-Lookup - Aufrufer hält _response_cache_lock."""
+    hit = _response_cache.get(key)
+    if hit is None:
+        return None
+    expires_at, response = hit
+    if expires_at < time.monotonic():
+        del _response_cache[key]
+        return None
+    _response_cache.move_to_end(key)
+    return response
+
+
+def _cache_set(key: bytes, response: str):
+    with _response_cache_lock:
+        _response_cache[key] = (time.monotonic() + RESPONSE_CACHE_TTL, response)
+        _response_cache.move_to_end(key)
+        if len(_response_cache) > RESPONSE_CACHE_SIZE:
+            _response_cache.popitem(last=False)
+
+
+def call_ollama(
+    model: str,
+    prompt: str,
+    ollama_url: str = "http://ollama:11434",
+    cache_response: bool = True,
+    keep_alive: str = OLLAMA_KEEP_ALIVE,
+    num_predict: Optional[int] = NUM_PREDICT_SINGLE,
+    stop_after_decision: bool = False,
+    json_format: bool = False
+) -> Dict:
     """
     Ruft Ollama Model auf und gibt Response zurück.
     
@@ -18,36 +124,101 @@ def call_ollama(model: str, prompt: str, ollama_url: str = "http://ollama:11434"
         model: Model name (z.B. "qwen3:4b")
         prompt: Der Prompt
         ollama_url: Ollama Base URL
+        cache_response: Erfolgreiche Antworten cachen (LRU + TTL)
+        keep_alive: Ollama keep_alive (z.B. "30m", "-1m" = dauerhaft geladen)
+        num_predict: Max. generierte Tokens (None = Ollama-Default)
+        stop_after_decision: Streamen und abbrechen, sobald Decision/Confidence/Reasoning
+            komplett sind (nur für Prompts im Decision-FORMAT)
+        json_format: Ollama format="json" - Antwort ist garantiert gültiges JSON
         
     Returns:
         {"response": "...", "success": True/False}
     """
+    if not cache_response:
+        return _generate(model, prompt, ollama_url, keep_alive, num_predict, stop_after_decision, json_format)
+    
+    key = _cache_key(model, prompt, num_predict, stop_after_decision, json_format)
+    
+    # Cache-Hit oder identischer Request schon unterwegs → kein eigener Call
+    with _response_cache_lock:
+        cached = _cache_lookup(key)
+        if cached is not None:
+            return {"response": cached, "success": True}
+        pending = _inflight.get(key)
+        if pending is None:
+            future = _inflight[key] = Future()
+    
+    if pending is not None:
+        return pending.result()
+    
+    result = {"response": "Error: aborted", "success": False}
+    try:
+        result = _generate(model, prompt, ollama_url, keep_alive, num_predict, stop_after_decision, json_format)
+        if result["success"]:
+            _cache_set(key, result["response"])
+    finally:
+        with _response_cache_lock:
+            del _inflight[key]
+        future.set_result(result)
+    
+    return result
+
+
+def _generate(
+    model: str,
+    prompt: str,
+    ollama_url: str,
+    keep_alive: str,
+    num_predict: Optional[int],
+    stop_after_decision: bool = False,
+    json_format: bool = False
+) -> Dict:
+    """Eigentlicher /api/generate-Call (ohne Cache)."""
+    options = {
+        "temperature": 0.0,  # Deterministisch (und damit cachebar)
+        "top_p": 1.0
+    }
+    if num_predict is not None:
+        options["num_predict"] = num_predict
+    
+    payload = {
+        "model": model,
+        "prompt": prompt,
+        "stream": stop_after_decision,
+        "keep_alive": keep_alive,
+        "options": options
+    }
+    if json_format:
+        # Constrained Decoding: Grammar lässt nur gültiges JSON zu
+        payload["format"] = "json"
+    
     try:
-        response = requests.post(
+        response = _get_session().post(
             f"{ollama_url}/api/generate",
-            json={
-                "model": model,
-                "prompt": prompt,
-                "stream": False,
-                "options": {
-                    "temperature": 0.3,  # Deterministisch
-                    "top_p": 0.9
-                }
-            },
-            timeout=30
+            data=orjson.dumps(payload),
+            headers=_JSON_HEADERS,
+            timeout=30,
+            stream=stop_after_decision
         )
         
-        if response.status_code == 200:
-            data = response.json()
-            return {
-                "response": data.get("response", ""),
-                "success": True
-            }
-        else:
+        if response.status_code != 200:
+            response.close()
             return {
                 "response": f"Error: HTTP {response.status_code}",
                 "success": False
             }
+        
+        if stop_after_decision:
+            return {
+                "response": _read_until_decision(response),
+                "success": True
+            }
+        
+        data = orjson.loads(response.content)
+        return {
+            "response": data.get("response", ""),
+            "success": True
+        }
             
     except Exception as e:
         return {
@@ -56,40 +227,248 @@ def call_ollama(model: str, prompt: str, ollama_url: str = "http://ollama:11434"
         }
 
 
+# Reasoning-Zeile ist fertig, sobald ein Zeilenumbruch folgt
+_REASONING_DONE_RE = re.compile(r"^Reasoning:.*\n", re.MULTILINE)
+_DECISION_CONFIDENCE_RE = re.compile(r"^Decision:.*^Confidence:", re.MULTILINE | re.DOTALL)
+
+
+def _read_until_decision(response: requests.Response) -> str:
+    """
+    Liest eine NDJSON-Stream-Response bis die Entscheidung komplett ist.
+    
+    Komplett heißt: JSON-Objekt geschlossen, bzw. im Zeilen-Format
+    Decision/Confidence/Reasoning vorhanden. Mehr braucht parse_ai_decision
+    nicht - danach wird die Verbindung geschlossen und Ollama bricht die
+    Generierung ab.
+    """
+    text = ""
+    try:
+        for line in response.iter_lines():
+            if not line:
+                continue
+            chunk = orjson.loads(line)
+            piece = chunk.get("response", "")
+            text += piece
+            if chunk.get("done"):
+                break
+            if "}" in piece and text.lstrip().startswith("{"):
+                try:
+                    orjson.loads(text)
+                    break
+                except ValueError:
+                    pass
+            # Nur bei neuem Zeilenumbruch kann eine Zeile fertig geworden sein
+            if "\n" in piece:
+                match = _REASONING_DONE_RE.search(text)
+                if match and _DECISION_CONFIDENCE_RE.search(text, 0, match.start()):
+                    break
+    finally:
+        response.close()
+    return text
+
+
+class OllamaPool:
+    """
+    Verteilt Calls auf mehrere Ollama-Backends (z.B. eine Instanz pro GPU).
+    
+    Jeder Call geht an das Backend mit den wenigsten laufenden Requests.
+    """
+    
+    def __init__(self, urls: List[str]):
+        self.urls = urls
+        self.inflight: Dict[str, int] = {url: 0 for url in urls}
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def from_url(cls, ollama_url: str) -> "OllamaPool":
+        """ollama_url darf eine komma-separierte Liste sein."""
+        urls = [u.strip() for u in ollama_url.split(",") if u.strip()]
+        return cls(urls)
+    
+    def call(
+        self,
+        model: str,
+        prompt: str,
+        num_predict: Optional[int] = NUM_PREDICT_SINGLE,
+        stop_after_decision: bool = False,
+        json_format: bool = False
+    ) -> Dict:
+        with self._lock:
+            url = min(self.urls, key=self.inflight.__getitem__)
+            self.inflight[url] += 1
+        try:
+            return call_ollama(
+                model, prompt, url,
+                num_predict=num_predict,
+                stop_after_decision=stop_after_decision,
+                json_format=json_format
+            )
+        finally:
+            with self._lock:
+                self.inflight[url] -= 1
+
+
+def call_ollama_batch(
+    model: str,
+    prompts: List[str],
+    ollama_url: str = "http://ollama:11434",
+    concurrency: int = OLLAMA_CONCURRENCY,
+    num_predict: Optional[int] = NUM_PREDICT_SINGLE,
+    stop_after_decision: bool = False,
+    json_format: bool = False
+) -> List[Dict]:
+    """
+    Ruft call_ollama für mehrere Prompts parallel auf.
+    
+    Netzwerk- und Queue-Wartezeit überlappen sich, statt sich pro
+    Entry aufzusummieren. Bei mehreren Backends (ollama_url komma-separiert)
+    laufen bis zu concurrency Requests pro Backend.
+    
+    Returns:
+        Liste von {"response": "...", "success": True/False}, gleiche Reihenfolge wie prompts
+    """
+    if not prompts:
+        return []
+    
+    backends = OllamaPool.from_url(ollama_url or "")
+    if not backends.urls:
+        return [{"response": "Error: no Ollama URL configured", "success": False} for _ in prompts]
+    
+    workers = min(concurrency * len(backends.urls), len(prompts))
+    
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(
+            lambda p: backends.call(model, p, num_predict, stop_after_decision, json_format),
+            prompts
+        ))
+
+
+def _parse_confidence(value) -> int:
+    """
+    Confidence als Prozent 0-100.
+    
+    Akzeptiert 85, 85.0, "85%" und Anteile wie 0.85 (Float bzw. Text mit
+    Dezimalpunkt, ohne %-Zeichen → ×100). Ganzzahlen bleiben Prozent: 1 ist 1%.
+    Unlesbares ergibt 0.
+    """
+    text = str(value).strip()
+    try:
+        confidence = float(text.rstrip("%").strip())
+        is_fraction = isinstance(value, float) or ("." in text and not text.endswith("%"))
+        if is_fraction and 0 < confidence <= 1.0:
+            confidence *= 100
+        return max(0, min(100, int(round(confidence))))
+    except (ValueError, OverflowError):
+        return 0
+
+
+def _normalize_decision(data: Dict) -> Dict:
+    """JSON-Objekt des Models → {"decision", "confidence", "reasoning"} mit festen Typen."""
+    confidence = _parse_confidence(data.get("confidence", 0))
+    
+    decision = data.get("decision")
+    return {
+        "decision": decision.strip().upper() if isinstance(decision, str) else None,
+        "confidence": confidence,
+        "reasoning": str(data.get("reasoning", ""))
+    }
+
+
 def parse_ai_decision(response: str) -> Dict:
     """
     Parst AI Response in strukturiertes Format.
     
-    Erwartet Format:
-    Decision: PROMOTE/KEEP/DUPLICATE/etc
-    Confidence: 85%
-    Reasoning: ...
+    Erwartet JSON (Ollama format="json"):
+    {"decision": "PROMOTE", "confidence": 85, "reasoning": "..."}
+    
+    Fällt auf das alte Zeilen-Format zurück (Decision:/Confidence:/Reasoning:),
+    falls das Model kein JSON geliefert hat.
     
     Returns:
         {"decision": "...", "confidence": 85, "reasoning": "..."}
     """
+    try:
+        data = orjson.loads(response)
+    except ValueError:
+        data = None
+    if isinstance(data, dict):
+        return _normalize_decision(data)
+    
+    return _legacy_parse(response)
+
+
+# Eine Regex für alle drei Zeilen-Typen (Scan in C statt startswith-Kaskade pro Zeile)
+_DECISION_LINE_RE = re.compile(r"^(Decision|Confidence|Reasoning):(.*)$", re.MULTILINE)
+
+
+def _legacy_parse(response: str) -> Dict:
+    """Zeilen-Format: Decision: .../Confidence: 85%/Reasoning: ..."""
     result = {
         "decision": None,
         "confidence": 0,
         "reasoning": ""
     }
     
-    lines = response.strip().split('\n')
-    for line in lines:
-        if line.startswith("Decision:"):
-            result["decision"] = line.split(":", 1)[1].strip()
-        elif line.startswith("Confidence:"):
-            conf_str = line.split(":", 1)[1].strip().replace("%", "")
-            try:
-                result["confidence"] = int(conf_str)
-            except:
-                pass
-        elif line.startswith("Reasoning:"):
-            result["reasoning"] = line.split(":", 1)[1].strip()
+    for match in _DECISION_LINE_RE.finditer(response.strip()):
+        field, value = match.group(1), match.group(2).strip()
+        if field == "Decision":
+            result["decision"] = value
+        elif field == "Confidence":
+            result["confidence"] = _parse_confidence(value)
+        else:
+            result["reasoning"] = value
     
     return result
 
 
+def parse_ai_decisions_batch(response: str) -> List[Dict]:
+    """
+    Parst eine Batch-Response.
+    
+    Erwartet {"decisions": [{"id": ..., ...}, ...]} (Ollama format="json"),
+    akzeptiert aber auch eine JSON-Zeile pro Eintrag. Einträge ohne
+    gültiges JSON oder ohne ID werden übersprungen - fehlende Einträge
+    muss der Aufrufer einzeln nachholen.
+    
+    Returns:
+        [{"id": ..., "decision": "...", "confidence": 85, "reasoning": "..."}, ...]
+    """
+    try:
+        data = orjson.loads(response)
+    except ValueError:
+        data = None
+    
+    if isinstance(data, dict):
+        items = data.get("decisions", [data])
+    elif isinstance(data, list):
+        items = data
+    else:
+        items = []
+        for line in response.splitlines():
+            line = line.strip().rstrip(",")
+            if not line.startswith("{"):
+                continue
+            try:
+                items.append(orjson.loads(line))
+            except ValueError:
+                continue
+    
+    decisions = []
+    for item in items if isinstance(items, list) else []:
+        if not isinstance(item, dict) or "id" not in item:
+            continue
+        decision = _normalize_decision(item)
+        decision["id"] = item["id"]
+        decisions.append(decision)
+    
+    return decisions
+
+
+def needs_validation(primary: Dict, threshold: int = VALIDATION_CONFIDENCE_THRESHOLD) -> bool:
+    """Slow Mode: nur unsichere Primary-Entscheidungen gehen an den Validator."""
+    return primary.get("confidence", 0) < threshold
+
+
 def write_conflict_log(conflicts: List[Dict], log_dir: str = "/app/data/maintenance_logs"):
     """
     Schreibt Conflicts in TXT File.
@@ -104,35 +483,43 @@ def write_conflict_log(conflicts: List[Dict], log_dir: str = "/app/data/maintena
     # Erstelle Verzeichnis falls nicht vorhanden
     os.makedirs(log_dir, exist_ok=True)
     
-    # Dateiname mit Timestamp
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    log_file = os.path.join(log_dir, f"maintenance_conflicts_{timestamp}.txt")
+    # Dateiname mit Timestamp (ein Zeitpunkt für Dateiname und Header)
+    now = datetime.now()
+    log_file = os.path.join(log_dir, f"maintenance_conflicts_{now.strftime('%Y-%m-%d_%H-%M-%S')}.txt")
     
-    with open(log_file, 'w', encoding='utf-8') as f:
-        f.write("=" * 60 + "\n")
-        f.write("MEMORY MAINTENANCE CONFLICTS\n")
-        f.write(f"Run: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write("=" * 60 + "\n\n")
-        
-        for i, conflict in enumerate(conflicts, 1):
-            f.write(f"CONFLICT #{i}\n")
-            f.write("-" * 60 + "\n")
-            f.write(f"Entry ID: {conflict.get('entry_id')}\n")
-            f.write(f"Content: \"{conflict.get('content')}\"\n")
-            f.write(f"Timestamp: {conflict.get('timestamp')}\n")
-            f.write(f"Layer: {conflict.get('layer')}\n\n")
+    # Ganzes Log im Speicher bauen, dann ein einziger write()
+    sep = "=" * 60
+    parts: List[str] = [
+        f"{sep}\n"
+        "MEMORY MAINTENANCE CONFLICTS\n"
+        f"Run: {now.strftime('%Y-%m-%d %H:%M:%S')}\n"
+        f"{sep}\n\n"
+    ]
+    
+    for i, conflict in enumerate(conflicts, 1):
+        parts.append(
+            f"CONFLICT #{i}\n"
+            f"{'-' * 60}\n"
+            f"Entry ID: {conflict.get('entry_id')}\n"
+            f"Content: \"{conflict.get('content')}\"\n"
+            f"Timestamp: {conflict.get('timestamp')}\n"
+            f"Layer: {conflict.get('layer')}\n\n"
             
-            f.write(f"PRIMARY DECISION ({conflict.get('primary_model')}):\n")
-            f.write(f"→ Action: {conflict.get('primary_action')}\n")
-            f.write(f"→ Reasoning: {conflict.get('primary_reasoning')}\n")
-            f.write(f"→ Confidence: {conflict.get('primary_confidence')}%\n\n")
+            f"PRIMARY DECISION ({conflict.get('primary_model')}):\n"
+            f"→ Action: {conflict.get('primary_action')}\n"
+            f"→ Reasoning: {conflict.get('primary_reasoning')}\n"
+            f"→ Confidence: {conflict.get('primary_confidence')}%\n\n"
             
-            f.write(f"VALIDATOR DECISION ({conflict.get('validator_model')}):\n")
-            f.write(f"→ Action: {conflict.get('validator_action')}\n")
-            f.write(f"→ Reasoning: {conflict.get('validator_reasoning')}\n")
-            f.write(f"→ Confidence: {conflict.get('validator_confidence')}%\n\n")
+            f"VALIDATOR DECISION ({conflict.get('validator_model')}):\n"
+            f"→ Action: {conflict.get('validator_action')}\n"
+            f"→ Reasoning: {conflict.get('validator_reasoning')}\n"
+            f"→ Confidence: {conflict.get('validator_confidence')}%\n\n"
             
-            f.write("RESOLUTION: SKIPPED (No consensus)\n")
-            f.write("\n" + "=" * 60 + "\n\n")
+            "RESOLUTION: SKIPPED (No consensus)\n"
+            f"\n{sep}\n\n"
+        )
+    
+    with open(log_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write("".join(parts))
     
     return log_file
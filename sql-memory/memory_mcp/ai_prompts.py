@@ -1,17 +1,45 @@
 """
 AI Prompts für Memory Maintenance Sorting
+
+Aufbau: feste Anweisungen/Kriterien/FORMAT zuerst, variable Eingaben
+ganz am Ende. So bleibt der Prompt-Prefix über alle Calls gleich und
+Ollama kann den KV-Cache dafür wiederverwenden.
 """
 
 # STM → LTM Promotion Prompt
 PROMOTION_PROMPT = """Du bist ein Memory-Klassifizierer.
 
-Analysiere diesen Memory-Eintrag und entscheide ob er von STM (Short-Term) zu LTM (Long-Term) promoted werden soll.
+Analysiere den Memory-Eintrag unten und entscheide ob er von STM (Short-Term) zu LTM (Long-Term) promoted werden soll.
 
+KRITERIEN FÜR LTM:
+✅ Dauerhafte Fakten (Name, Wohnort, Beruf, Hobbies)
+✅ Wichtige Präferenzen (Lieblingsessen, Abneigungen)
+✅ Beziehungen (Familie, Freunde, Kollegen)
+✅ Langfristige Ziele/Pläne
+✅ Wichtige Ereignisse mit Langzeitwirkung
+
+KRITERIEN FÜR STM BLEIBEN:
+❌ Temporäre Stimmungen/Gefühle
+❌ Kurzfristige Pläne (heute, morgen)
+❌ Aktuelle Events ohne Dauerwirkung
+❌ Kontext-gebundene Infos
+
+FORMAT:
+Antworte NUR mit JSON:
+{{"decision": "PROMOTE" oder "KEEP", "confidence": <0-100>, "reasoning": "<kurze Erklärung>"}}
+
+---
 EINTRAG:
 ID: {entry_id}
 Content: "{content}"
 Erstellt: {created_at}
-Alter: {age_days} Tage
+Alter: {age_days} Tage"""
+
+
+# STM → LTM Promotion Prompt für mehrere Einträge auf einmal (ein Call pro Batch)
+PROMOTION_PROMPT_BATCH = """Du bist ein Memory-Klassifizierer.
+
+Analysiere JEDEN Memory-Eintrag unten und entscheide ob er von STM (Short-Term) zu LTM (Long-Term) promoted werden soll.
 
 KRITERIEN FÜR LTM:
 ✅ Dauerhafte Fakten (Name, Wohnort, Beruf, Hobbies)
@@ -26,27 +54,19 @@ KRITERIEN FÜR STM BLEIBEN:
 ❌ Aktuelle Events ohne Dauerwirkung
 ❌ Kontext-gebundene Infos
 
-DENKE LAUT:
-Analysiere den Inhalt und erkläre deine Entscheidung.
-
 FORMAT:
-Decision: [PROMOTE/KEEP]
-Confidence: [0-100]%
-Reasoning: [Deine Erklärung]"""
+Antworte NUR mit JSON, ein Objekt pro Eintrag:
+{{"decisions": [{{"id": <ID>, "decision": "PROMOTE" oder "KEEP", "confidence": <0-100>, "reasoning": "<kurze Erklärung>"}}, ...]}}
+
+---
+EINTRÄGE (ID | Alter in Tagen | Content):
+{entries_table}"""
 
 
 # Duplicate Detection Prompt
 DUPLICATE_PROMPT = """Du bist ein Duplicate-Detector.
 
-Vergleiche diese beiden Memory-Einträge:
-
-ENTRY A:
-ID: {entry_a_id}
-Content: "{entry_a_content}"
-
-ENTRY B:
-ID: {entry_b_id}
-Content: "{entry_b_content}"
+Vergleiche die beiden Memory-Einträge unten.
 
 FRAGEN:
 1. Enthalten sie die GLEICHE Information?
@@ -57,16 +77,22 @@ FORMAT:
 Decision: [DUPLICATE/DIFFERENT]
 Similarity: [0-100]%
 Keep: [Entry A ID / Entry B ID / Both]
-Reasoning: [Erklärung]"""
+Reasoning: [Erklärung]
+
+---
+ENTRY A:
+ID: {entry_a_id}
+Content: "{entry_a_content}"
+
+ENTRY B:
+ID: {entry_b_id}
+Content: "{entry_b_content}\""""
 
 
 # Summary Creation Prompt
 SUMMARY_PROMPT = """Du bist ein Memory-Zusammenfasser.
 
-Erstelle eine kompakte MTM (Mid-Term Memory) Zusammenfassung aus diesen STM Einträgen:
-
-EINTRÄGE:
-{entries}
+Erstelle eine kompakte MTM (Mid-Term Memory) Zusammenfassung aus den STM Einträgen unten.
 
 ANFORDERUNGEN:
 ✅ Kernaussagen bewahren
@@ -78,26 +104,30 @@ ANFORDERUNGEN:
 FORMAT:
 Summary: [Deine Zusammenfassung]
 Entries_Combined: [Anzahl]
-Reasoning: [Kurze Erklärung]"""
+Reasoning: [Kurze Erklärung]
+
+---
+EINTRÄGE:
+{entries}"""
 
 
 # Slow Mode Validation Prompt
 VALIDATION_PROMPT = """Du bist ein Quality Validator.
 
-Das Primary Model hat folgende Entscheidung getroffen:
+Das Primary Model hat die Entscheidung unten getroffen.
+
+DEINE AUFGABE:
+Validiere diese Entscheidung kritisch.
+
+FORMAT:
+Antworte NUR mit JSON:
+{{"decision": "APPROVE" oder "REJECT", "confidence": <0-100>, "reasoning": "<kurze Analyse>"}}
 
+---
 ORIGINAL ENTRY:
 "{content}"
 
 PRIMARY DECISION:
 Action: {action}
 Reasoning: {reasoning}
-Confidence: {confidence}%
-
-DEINE AUFGABE:
-Validiere diese Entscheidung kritisch.
-
-FORMAT:
-Decision: [APPROVE/REJECT]
-Confidence: [0-100]%
-Reasoning: [Deine Analyse]"""
+Confidence: {confidence}%"""
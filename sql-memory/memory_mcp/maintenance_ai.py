@@ -13,8 +13,76 @@ import os
 
 # Import helpers
 sys.path.insert(0, os.path.dirname(__file__))
-from ai_helpers import call_ollama, parse_ai_decision, write_conflict_log
-from ai_prompts import PROMOTION_PROMPT, DUPLICATE_PROMPT, VALIDATION_PROMPT
+from ai_helpers import NUM_PREDICT_PER_ENTRY, call_ollama_batch, needs_validation, parse_ai_decision, parse_ai_decisions_batch, write_conflict_log
+from ai_prompts import PROMOTION_PROMPT, PROMOTION_PROMPT_BATCH, DUPLICATE_PROMPT, VALIDATION_PROMPT
+
+# Entries pro Promotion-Prompt (Prefill-Overhead einmal pro Batch statt pro Entry)
+PROMOTION_BATCH_SIZE = 10
+
+# Draft-Entscheidungen unter dieser Confidence klassifiziert das Primary Model erneut
+DRAFT_CONFIDENCE_THRESHOLD = 80
+
+# Max. Zeichen Content pro Entry in allen Prompts (Batch, Einzel, Validator)
+PROMPT_CONTENT_MAX_CHARS = 200
+
+
+def _prompt_content(content: str) -> str:
+    """
+    Content für eine Prompt-Zeile: einzeilig, ohne Trennzeichen, gekürzt.
+    
+    Zeilenumbrüche, | und " würden die Batch-Tabelle (ID | Alter | "Content")
+    verschieben - dann landen Entscheidungen bei der falschen ID.
+    """
+    text = " ".join(str(content).split())
+    text = text.replace("|", "/").replace('"', "'")
+    return text[:PROMPT_CONTENT_MAX_CHARS]
+
+
+def _classify_entries(model: str, rows: List[tuple], ollama_url: str) -> Dict[str, Dict]:
+    """
+    Klassifiziert (entry_id, content, created_at, age_days)-Rows für die LTM-Promotion.
+    
+    PROMOTION_BATCH_SIZE Entries pro Prompt, Batches parallel. Entries, die
+    in der Batch-Antwort fehlen, werden einzeln nachgeholt.
+    
+    Returns:
+        {str(entry_id): decision} - fehlgeschlagene Entries fehlen
+    """
+    chunks = [rows[i:i + PROMOTION_BATCH_SIZE] for i in range(0, len(rows), PROMOTION_BATCH_SIZE)]
+    batch_prompts = [
+        PROMOTION_PROMPT_BATCH.format(entries_table="\n".join(
+            f'{entry_id} | {age_days} | "{content}"'
+            for entry_id, content, _, age_days in chunk
+        ))
+        for chunk in chunks
+    ]
+    
+    decisions_by_id: Dict[str, Dict] = {}
+    num_predict = NUM_PREDICT_PER_ENTRY * PROMOTION_BATCH_SIZE
+    for ai_response in call_ollama_batch(model, batch_prompts, ollama_url, num_predict=num_predict, json_format=True):
+        if ai_response["success"]:
+            for decision in parse_ai_decisions_batch(ai_response["response"]):
+                decisions_by_id[str(decision["id"])] = decision
+    
+    # Einträge, die im Batch fehlen → einzeln nachholen
+    missing = [row for row in rows if str(row[0]) not in decisions_by_id]
+    single_prompts = [
+        PROMOTION_PROMPT.format(
+            entry_id=entry_id,
+            content=content,
+            created_at=created_at,
+            age_days=age_days
+        )
+        for entry_id, content, created_at, age_days in missing
+    ]
+    for (entry_id, _, _, _), ai_response in zip(missing, call_ollama_batch(model, single_prompts, ollama_url, stop_after_decision=True, json_format=True)):
+        if ai_response["success"]:
+            decisions_by_id[str(entry_id)] = parse_ai_decision(ai_response["response"])
+    
+    for decision in decisions_by_id.values():
+        decision["model"] = model
+    
+    return decisions_by_id
 
 
 def maintenance_run_ai(
@@ -22,7 +90,8 @@ def maintenance_run_ai(
     model: str = "qwen3:4b",
     validator_model: Optional[str] = None,
     ollama_url: str = "http://ollama:11434",
-    stream_callback: Optional[Callable] = None
+    stream_callback: Optional[Callable] = None,
+    draft_model: Optional[str] = None
 ) -> Dict:
     """
     AI-gestütztes Memory Maintenance.
@@ -31,8 +100,10 @@ def maintenance_run_ai(
         db_path: Path zur SQLite DB
         model: Primary Ollama Model
         validator_model: Optional Validator für Slow Mode
-        ollama_url: Ollama Endpoint
+        ollama_url: Ollama Endpoint (komma-separiert für mehrere Backends)
         stream_callback: Optional Callback für Live Updates
+        draft_model: Optional kleines Model für einen ersten Durchlauf (z.B. 'qwen3:0.6b'),
+            das Primary Model klassifiziert dann nur noch unsichere Entries
         
     Returns:
         Results Dict mit Stats und Conflict Log
@@ -48,6 +119,8 @@ def maintenance_run_ai(
     
     emit("info", {"message": f"Mode: {'Slow (Dual Validation)' if slow_mode else 'Normal'}"})
     emit("info", {"message": f"Primary Model: {model}"})
+    if draft_model:
+        emit("info", {"message": f"Draft Model: {draft_model}"})
     if slow_mode:
         emit("info", {"message": f"Validator Model: {validator_model}"})
     
@@ -92,12 +165,9 @@ def maintenance_run_ai(
         
         emit("info", {"message": f"Gefunden: {len(stm_entries)} STM Entries"})
         
-        promoted_count = 0
-        for idx, (entry_id, content, created_at, layer) in enumerate(stm_entries):
-            # Progress
-            progress = int((idx / max(len(stm_entries), 1)) * 40)  # 0-40%
-            emit("progress", {"progress": progress})
-            
+        # Einträge vorbereiten
+        rows = []
+        for entry_id, content, created_at, layer in stm_entries:
             # Berechne Alter
             try:
                 entry_date = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
@@ -105,67 +175,95 @@ def maintenance_run_ai(
             except:
                 age_days = 0
             
-            # AI Analyse
-            emit("thinking", {"message": f"🤔 Analysiere Entry #{entry_id}..."})
+            rows.append((entry_id, _prompt_content(content), created_at, age_days))
+        
+        # AI Analyse - Primary Model, PROMOTION_BATCH_SIZE Entries pro Prompt, Batches parallel
+        emit("thinking", {"message": f"🤔 Analysiere {len(rows)} Entries..."})
+        if draft_model:
+            # Tiered: Draft-Model für alle, das große Model nur für unsichere/fehlende Entries
+            draft_decisions = _classify_entries(draft_model, rows, ollama_url)
+            uncertain = [
+                row for row in rows
+                if draft_decisions.get(str(row[0]), {}).get("confidence", 0) < DRAFT_CONFIDENCE_THRESHOLD
+            ]
+            emit("thinking", {"message": f"🧠 {model} prüft {len(uncertain)} unsichere Entries..."})
+            decisions_by_id = {**draft_decisions, **_classify_entries(model, uncertain, ollama_url)}
+        else:
+            decisions_by_id = _classify_entries(model, rows, ollama_url)
+        
+        primary_decisions: List[Optional[Dict]] = []
+        for entry_id, _, _, _ in stm_entries:
+            decision = decisions_by_id.get(str(entry_id))
+            if decision is None:
+                emit("warning", {"message": f"AI Error für Entry #{entry_id}"})
+            else:
+                results["ai_decisions"] += 1
+            primary_decisions.append(decision)
+        
+        # Slow Mode: Validation - nur unsichere PROMOTE-Entscheidungen, ebenfalls parallel
+        validator_decisions: Dict[int, Optional[Dict]] = {}
+        if slow_mode:
+            to_validate = [
+                idx for idx, decision in enumerate(primary_decisions)
+                if decision and decision.get("decision") == "PROMOTE" and needs_validation(decision)
+            ]
+            if to_validate:
+                emit("thinking", {"message": f"🔍 Validator prüft {len(to_validate)} Entries..."})
             
-            prompt = PROMOTION_PROMPT.format(
-                entry_id=entry_id,
-                content=content[:200],  # Limit für Performance
-                created_at=created_at,
-                age_days=age_days
-            )
+            val_prompts = [
+                VALIDATION_PROMPT.format(
+                    content=_prompt_content(stm_entries[idx][1]),
+                    action="STM → LTM",
+                    reasoning=primary_decisions[idx].get('reasoning', ''),
+                    confidence=primary_decisions[idx].get('confidence', 0)
+                )
+                for idx in to_validate
+            ]
             
-            # Primary Model
-            ai_response = call_ollama(model, prompt, ollama_url)
-            if not ai_response["success"]:
-                emit("warning", {"message": f"AI Error für Entry #{entry_id}"})
-                continue
+            for idx, val_response in zip(to_validate, call_ollama_batch(validator_model, val_prompts, ollama_url, stop_after_decision=True, json_format=True)):
+                validator_decisions[idx] = (
+                    parse_ai_decision(val_response["response"]) if val_response["success"] else None
+                )
+        
+        promoted_count = 0
+        for idx, (entry_id, content, created_at, layer) in enumerate(stm_entries):
+            # Progress
+            progress = int((idx / max(len(stm_entries), 1)) * 40)  # 0-40%
+            emit("progress", {"progress": progress})
             
-            primary_decision = parse_ai_decision(ai_response["response"])
-            results["ai_decisions"] += 1
+            primary_decision = primary_decisions[idx]
+            if primary_decision is None:
+                continue
             
             emit("thinking", {
                 "message": f"💭 {primary_decision.get('reasoning', 'No reasoning')[:100]}..."
             })
             
-            # Slow Mode: Validation
-            if slow_mode and primary_decision.get("decision") == "PROMOTE":
-                emit("thinking", {"message": f"🔍 Validator prüft Entry #{entry_id}..."})
-                
-                val_prompt = VALIDATION_PROMPT.format(
-                    content=content[:200],
-                    action="STM → LTM",
-                    reasoning=primary_decision.get('reasoning', ''),
-                    confidence=primary_decision.get('confidence', 0)
-                )
-                
-                val_response = call_ollama(validator_model, val_prompt, ollama_url)
-                if val_response["success"]:
-                    validator_decision = parse_ai_decision(val_response["response"])
+            validator_decision = validator_decisions.get(idx)
+            if validator_decision is not None:
+                # Check Consensus
+                if validator_decision.get("decision") == "REJECT":
+                    # CONFLICT!
+                    emit("warning", {"message": f"⚠️ Conflict bei Entry #{entry_id}"})
                     
-                    # Check Consensus
-                    if validator_decision.get("decision") == "REJECT":
-                        # CONFLICT!
-                        emit("warning", {"message": f"⚠️ Conflict bei Entry #{entry_id}"})
-                        
-                        conflicts.append({
-                            "entry_id": entry_id,
-                            "content": content,
-                            "timestamp": created_at,
-                            "layer": layer,
-                            "primary_model": model,
-                            "primary_action": "PROMOTE",
-                            "primary_reasoning": primary_decision.get('reasoning', ''),
-                            "primary_confidence": primary_decision.get('confidence', 0),
-                            "validator_model": validator_model,
-                            "validator_action": "REJECT",
-                            "validator_reasoning": validator_decision.get('reasoning', ''),
-                            "validator_confidence": validator_decision.get('confidence', 0)
-                        })
-                        results["conflicts_count"] += 1
-                        continue  # Skip bei Conflict
-                    else:
-                        emit("success", {"message": f"✅✅ Double-Approved: Entry #{entry_id}"})
+                    conflicts.append({
+                        "entry_id": entry_id,
+                        "content": content,
+                        "timestamp": created_at,
+                        "layer": layer,
+                        "primary_model": primary_decision.get("model", model),
+                        "primary_action": "PROMOTE",
+                        "primary_reasoning": primary_decision.get('reasoning', ''),
+                        "primary_confidence": primary_decision.get('confidence', 0),
+                        "validator_model": validator_model,
+                        "validator_action": "REJECT",
+                        "validator_reasoning": validator_decision.get('reasoning', ''),
+                        "validator_confidence": validator_decision.get('confidence', 0)
+                    })
+                    results["conflicts_count"] += 1
+                    continue  # Skip bei Conflict
+                else:
+                    emit("success", {"message": f"✅✅ Double-Approved: Entry #{entry_id}"})
             
             # Execute Decision
             if primary_decision.get("decision") == "PROMOTE":
@@ -259,6 +357,7 @@ def maintenance_run_ai(
             "models_used": {
                 "primary": model,
                 "validator": validator_model,
+                "draft": draft_model,
                 "slow_mode": slow_mode
             }
         }
@@ -61,15 +61,14 @@ def register_tools(mcp):
     # --------------------------------------------------
     # memory_fact_save (strukturierte Fakten)
     # --------------------------------------------------
-    @mcp.tool
-    def memory_fact_save(
+    def _save_fact(
         conversation_id: str,
         key: str,
         value: str,
         subject: str = "Danny",
         layer: str = "ltm"
-    ) -> Dict:
-        """Speichert strukturierte Fakten."""
+    ) -> int:
+        """Fakt + Embedding + Graph-Node speichern (gemeinsam für Einzel- und Bulk-Save)."""
         new_id = insert_fact(conversation_id, subject, key, value, layer)
 
         content = f"{subject} {key}: {value}"
@@ -102,6 +101,19 @@ def register_tools(mcp):
         except Exception as e:
             print (f"[memory_fact_save] Graph failed: {e}")
 
+        return new_id
+
+    @mcp.tool
+    def memory_fact_save(
+        conversation_id: str,
+        key: str,
+        value: str,
+        subject: str = "Danny",
+        layer: str = "ltm"
+    ) -> Dict:
+        """Speichert strukturierte Fakten."""
+        new_id = _save_fact(conversation_id, key, value, subject, layer)
+
         return {
             "result": f"Fact saved {new_id}",
             "structuredContent": {
@@ -112,6 +124,36 @@ def register_tools(mcp):
                 "layer": layer
             }
         }
+
+    # --------------------------------------------------
+    # memory_fact_save_bulk (mehrere Fakten, ein RPC - FOR MAINTENANCE)
+    # --------------------------------------------------
+    @mcp.tool
+    def memory_fact_save_bulk(facts: List[Dict]) -> Dict:
+        """
+        Speichert mehrere Fakten in einem Call.
+        Jeder Fakt: {"conversation_id", "key", "value", optional "subject", "layer"}.
+        """
+        ids = []
+        errors = []
+        for fact in facts:
+            try:
+                ids.append(_save_fact(
+                    fact["conversation_id"],
+                    fact["key"],
+                    fact["value"],
+                    fact.get("subject", "Danny"),
+                    fact.get("layer", "ltm"),
+                ))
+            except Exception as e:
+                errors.append(f"{fact.get('key')}: {e}")
+
+        return {
+            "saved": len(ids),
+            "ids": ids,
+            "errors": errors,
+        }
+
     # --------------------------------------------------
     # memory_fact_load (Fakt abrufen)
     # --------------------------------------------------
@@ -496,7 +538,8 @@ def register_tools(mcp):
     def maintenance_run(
         model: str = "qwen3:4b",
         validator_model = None,
-        ollama_url: str = "http://ollama:11434"
+        ollama_url: str = "http://ollama:11434",
+        draft_model = None
     ) -> Dict:
         """
         AI-gestütztes Memory Maintenance.
@@ -504,7 +547,8 @@ def register_tools(mcp):
         Args:
             model: Primary Ollama Model (z.B. 'qwen3:4b', 'deepseek-r1:8b')
             validator_model: Optional Validator für Slow Mode (z.B. 'llama3.1:8b')
-            ollama_url: Ollama Endpoint URL (default: http://ollama:11434)
+            ollama_url: Ollama Endpoint URL (default: http://ollama:11434), komma-separiert für mehrere Backends
+            draft_model: Optional kleines Model für den ersten Durchlauf (z.B. 'qwen3:0.6b')
             
         Returns:
             Maintenance Results mit AI Decisions und optional Conflict Log
@@ -519,7 +563,8 @@ def register_tools(mcp):
             validator_model=validator_model,
             ollama_url=ollama_url,
 
-            stream_callback=None
+            stream_callback=None,
+            draft_model=draft_model
         )
     # memory_all_recent (NEW - FOR MAINTENANCE)
     @mcp.tool
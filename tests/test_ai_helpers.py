@@ -0,0 +1,129 @@
+# tests/test_ai_helpers.py
+"""
+Tests für das Parsen der Maintenance-Entscheidungen (sql-memory).
+
+Confidence-Werte steuern Validierung und Draft-Tier - ein falsch
+geparster Wert schickt jede Entscheidung unnötig an den Validator.
+"""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+# Per Dateipfad laden: sql-memory/memory_mcp auf sys.path würde dessen config.py
+# vor die config.py der Bridge schieben
+_spec = importlib.util.spec_from_file_location(
+    "sql_memory_ai_helpers",
+    Path(__file__).parent.parent / "sql-memory" / "memory_mcp" / "ai_helpers.py",
+)
+ai_helpers = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(ai_helpers)
+
+_normalize_decision = ai_helpers._normalize_decision
+parse_ai_decision = ai_helpers.parse_ai_decision
+parse_ai_decisions_batch = ai_helpers.parse_ai_decisions_batch
+call_ollama_batch = ai_helpers.call_ollama_batch
+
+
+class TestNormalizeDecision:
+    """Tests für Typen und Confidence-Formate aus format=json."""
+
+    @pytest.mark.parametrize("raw, expected", [
+        (85, 85),
+        (85.0, 85),
+        (0.85, 85),
+        ("85%", 85),
+        ("85.5%", 86),
+        ("0.9", 90),
+        (1.0, 100),
+        (1, 1),
+        ("1", 1),
+        ("0.85", 85),
+        ("1%", 1),
+        ("0.5%", 0),
+        (0, 0),
+        (250, 100),
+        ("hoch", 0),
+        (None, 0),
+        ("nan", 0),
+    ])
+    def test_confidence_formats(self, raw, expected):
+        """Int, Float, Anteil, Prozent-String und Müll."""
+        assert _normalize_decision({"confidence": raw})["confidence"] == expected
+
+    def test_decision_upper_and_defaults(self):
+        """Decision wird normalisiert, fehlende Felder bekommen Defaults."""
+        result = _normalize_decision({"decision": " promote "})
+
+        assert result == {"decision": "PROMOTE", "confidence": 0, "reasoning": ""}
+
+    def test_non_string_decision(self):
+        """Nicht-String-Decision wird None."""
+        assert _normalize_decision({"decision": 1})["decision"] is None
+
+
+class TestParseAiDecision:
+    """Tests für JSON-Antworten und das alte Zeilen-Format."""
+
+    def test_json(self):
+        result = parse_ai_decision('{"decision": "KEEP", "confidence": 0.7, "reasoning": "temporär"}')
+
+        assert result == {"decision": "KEEP", "confidence": 70, "reasoning": "temporär"}
+
+    def test_legacy_lines(self):
+        """Fallback auf Decision:/Confidence:/Reasoning:."""
+        result = parse_ai_decision("Decision: PROMOTE\nConfidence: 85%\nReasoning: Wohnort")
+
+        assert result == {"decision": "PROMOTE", "confidence": 85, "reasoning": "Wohnort"}
+
+    def test_legacy_float_confidence(self):
+        assert parse_ai_decision("Decision: KEEP\nConfidence: 72.5%")["confidence"] == 72
+
+    def test_garbage(self):
+        """Unlesbare Antwort → leere Entscheidung statt Exception."""
+        result = parse_ai_decision("Ich weiß es nicht.")
+
+        assert result == {"decision": None, "confidence": 0, "reasoning": ""}
+
+
+class TestParseAiDecisionsBatch:
+    """Tests für Batch-Antworten (Objekt mit decisions oder JSON-Zeilen)."""
+
+    def test_decisions_object(self):
+        response = '{"decisions": [{"id": 1, "decision": "promote", "confidence": 90.0}, {"id": 2, "decision": "KEEP", "confidence": "40%"}]}'
+
+        result = parse_ai_decisions_batch(response)
+
+        assert [(d["id"], d["decision"], d["confidence"]) for d in result] == [(1, "PROMOTE", 90), (2, "KEEP", 40)]
+
+    def test_json_lines(self):
+        response = 'Klar:\n{"id": 3, "decision": "KEEP", "confidence": 0.5},\n{"id": 4, "decision": "PROMOTE", "confidence": 88}'
+
+        result = parse_ai_decisions_batch(response)
+
+        assert [(d["id"], d["confidence"]) for d in result] == [(3, 50), (4, 88)]
+
+    def test_skips_invalid_entries(self):
+        """Einträge ohne ID oder ohne Objekt-Form werden übersprungen."""
+        response = '{"decisions": [{"decision": "KEEP"}, 5, {"id": 6, "decision": "KEEP"}]}'
+
+        assert [d["id"] for d in parse_ai_decisions_batch(response)] == [6]
+
+    @pytest.mark.parametrize("response", ["garbage", "", '{"decisions": 3}', "[1, 2]"])
+    def test_garbage(self, response):
+        assert parse_ai_decisions_batch(response) == []
+
+
+class TestCallOllamaBatch:
+    """Tests für Eingaben, die nie einen Request auslösen dürfen."""
+
+    def test_empty_prompts(self):
+        assert call_ollama_batch("m", [], "http://ollama:11434") == []
+
+    @pytest.mark.parametrize("url", ["", " , ", None])
+    def test_no_url(self, url):
+        """Keine URL → Fehler-Result pro Prompt statt ValueError."""
+        result = call_ollama_batch("m", ["a", "b"], url)
+
+        assert [r["success"] for r in result] == [False, False]
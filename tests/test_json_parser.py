@@ -7,7 +7,7 @@ Diese Tests stellen sicher, dass er mit allen LLM-Outputs umgehen kann.
 """
 
 import pytest
-from utils.json_parser import safe_parse_json, extract_json_array, _attempt_json_repair
+from utils.json_parser import safe_parse_json, extract_json_array, extract_first_json, _attempt_json_repair
 
 
 class TestSafeParseJson:
@@ -198,3 +198,35 @@ Hier ist meine Analyse:
         raw = '{"intent": "Größe abfragen", "value": "größer"}'
         result = safe_parse_json(raw)
         assert "Größe" in result["intent"]
+
+
+class TestExtractFirstJson:
+    """Tests für den Klammer-Scanner extract_first_json."""
+    
+    def test_text_around_json(self):
+        """Text vor und nach dem Objekt wird ignoriert."""
+        raw = 'Hier das Ergebnis: {"duplicates": [[0, 1]]} Ich hoffe das hilft {x}'
+        assert extract_first_json(raw) == {"duplicates": [[0, 1]]}
+    
+    def test_nested_objects(self):
+        """Verschachtelte Objekte werden komplett erfasst."""
+        raw = '{"to_ltm": [{"index": 0, "key": "user_name"}], "to_delete": [1]}'
+        assert extract_first_json(raw)["to_ltm"][0]["key"] == "user_name"
+    
+    def test_braces_in_strings(self):
+        """Klammern und escapte Quotes in Strings zählen nicht."""
+        raw = '{"reason": "sagt \\"}\\" und {", "ok": true} rest'
+        assert extract_first_json(raw) == {"reason": 'sagt "}" und {', "ok": True}
+    
+    def test_incomplete_stream(self):
+        """Unfertiges Objekt (laufender Stream) → None."""
+        assert extract_first_json('{"duplicates": [[0, 1]') is None
+    
+    def test_skips_invalid_candidate(self):
+        """Ungültiger {...}-Block wird übersprungen."""
+        raw = 'Format: {index} → {"to_delete": [2]}'
+        assert extract_first_json(raw) == {"to_delete": [2]}
+    
+    def test_no_json(self):
+        """Kein Objekt im Text → None."""
+        assert extract_first_json("keine Duplikate gefunden") is None
@@ -0,0 +1,122 @@
+# tests/test_maintenance_status.py
+"""
+Tests für den ETag-Cache von /api/maintenance/status (LobeChat-Router).
+
+Der Memory-Service wird durch einen Stub-Client in app.state.mem_client
+ersetzt, die Uhr für die TTL durch einen Zähler.
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from adapters._sse import encode as sse
+from adapters.lobechat import maintenance_endpoints
+
+
+class _StubResponse:
+    status_code = 200
+
+    def __init__(self, content: bytes):
+        self.content = content
+
+
+class _StubClient:
+    """Liefert memory_graph_stats als SSE-Frame, zählt die Upstream-Calls."""
+
+    def __init__(self):
+        self.calls = 0
+        self.stm = 1
+
+    async def post(self, *args, **kwargs):
+        self.calls += 1
+        return _StubResponse(sse({"result": {"structuredContent": {
+            "node_types": {"stm": self.stm, "mtm": 0, "ltm": 2},
+            "nodes": 3,
+            "edges": 1,
+        }}}))
+
+
+@pytest.fixture
+def status_env(monkeypatch):
+    """App mit Stub-Client, leerem Cache und steuerbarer Uhr."""
+    stub = _StubClient()
+    clock = [100.0]
+
+    monkeypatch.setattr(maintenance_endpoints.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(maintenance_endpoints, "_status_cache", {"body": None, "etag": None, "expires": 0.0})
+
+    app = FastAPI()
+    app.state.mem_client = stub
+    app.include_router(maintenance_endpoints.router)
+    return TestClient(app), stub, clock
+
+
+class TestMaintenanceStatusCache:
+    """Tests für 304, TTL-Ablauf und ETag-Wechsel."""
+
+    def test_body_and_etag(self, status_env):
+        client, stub, _ = status_env
+
+        r = client.get("/api/maintenance/status")
+
+        assert r.status_code == 200
+        assert r.json()["memory"]["stm_entries"] == 1
+        assert r.headers["etag"]
+
+    def test_not_modified_within_ttl(self, status_env):
+        """Passender If-None-Match innerhalb der TTL → 304 ohne Upstream-Call."""
+        client, stub, _ = status_env
+        etag = client.get("/api/maintenance/status").headers["etag"]
+
+        r = client.get("/api/maintenance/status", headers={"If-None-Match": etag})
+
+        assert r.status_code == 304
+        assert stub.calls == 1
+
+    def test_expiry_refetches(self, status_env):
+        """Nach Ablauf der TTL wird upstream neu gefragt."""
+        client, stub, clock = status_env
+        client.get("/api/maintenance/status")
+
+        clock[0] += maintenance_endpoints.STATUS_CACHE_TTL + 0.1
+        client.get("/api/maintenance/status")
+
+        assert stub.calls == 2
+
+    def test_etag_changes_with_stats(self, status_env):
+        """Neue Upstream-Stats → neuer ETag, alter ETag bekommt den Body."""
+        client, stub, clock = status_env
+        old_etag = client.get("/api/maintenance/status").headers["etag"]
+
+        stub.stm = 7
+        clock[0] += maintenance_endpoints.STATUS_CACHE_TTL + 0.1
+        r = client.get("/api/maintenance/status", headers={"If-None-Match": old_etag})
+
+        assert r.status_code == 200
+        assert r.headers["etag"] != old_etag
+        assert r.json()["memory"]["stm_entries"] == 7
+
+
+class TestMemClientLifecycle:
+    """Tests für app.state.mem_client aus der LobeChat-Lifespan."""
+
+    def test_without_client_falls_back(self, monkeypatch):
+        """App ohne Lifespan-Client → 200 mit Null-Stats statt 500."""
+        monkeypatch.setattr(maintenance_endpoints, "_status_cache", {"body": None, "etag": None, "expires": 0.0})
+        app = FastAPI()
+        app.include_router(maintenance_endpoints.router)
+
+        r = TestClient(app).get("/api/maintenance/status")
+
+        assert r.status_code == 200
+        assert r.json()["memory"]["stm_entries"] == 0
+
+    def test_lobechat_lifespan_creates_and_closes_client(self):
+        from adapters.lobechat.main import app
+
+        with TestClient(app):
+            client = app.state.mem_client
+            assert not client.is_closed
+
+        assert client.is_closed
@@ -0,0 +1,107 @@
+# tests/test_maintenance_worker.py
+"""
+Tests für die reinen Helfer des Maintenance-Workers.
+"""
+
+from maintenance.worker import MaintenanceStats, _count_ok, _format_entries_bounded
+
+
+class TestMaintenanceStats:
+    """Tests für den versionierten to_dict()-Cache."""
+
+    def test_cached_dict_reused_without_changes(self):
+        """Ohne Feld-Write liefert to_dict() dasselbe Objekt."""
+        stats = MaintenanceStats()
+
+        assert stats.to_dict() is stats.to_dict()
+
+    def test_field_write_rebuilds_dict(self):
+        """Feld-Zuweisung invalidiert den Cache - kein veralteter Fortschritt."""
+        stats = MaintenanceStats()
+        before = stats.to_dict()
+
+        stats.promoted_to_ltm += 3
+        stats.started_at_iso = "2026-01-01T00:00:00"
+        after = stats.to_dict()
+
+        assert after is not before
+        assert after["actions"]["promoted_to_ltm"] == 3
+        assert after["started_at"] == "2026-01-01T00:00:00"
+        assert before["actions"]["promoted_to_ltm"] == 0
+
+    def test_errors_append_rebuilds_dict(self):
+        """errors.append() ist keine Zuweisung, muss aber trotzdem durchschlagen."""
+        stats = MaintenanceStats()
+        stats.to_dict()
+
+        stats.errors.append("Dedupe fehlgeschlagen")
+
+        assert stats.to_dict()["errors"] == ["Dedupe fehlgeschlagen"]
+
+    def test_init_values(self):
+        """Konstruktor-Werte landen im Dict (Versionierung schon in __init__)."""
+        stats = MaintenanceStats(stm_entries=5, ltm_entries=2)
+
+        counts = stats.to_dict()["counts"]
+
+        assert (counts["stm_entries"], counts["ltm_entries"]) == (5, 2)
+
+
+class TestFormatEntriesBounded:
+    """Tests für das Zeichen-Budget der Prompt-Einträge."""
+
+    def test_empty_list(self):
+        assert _format_entries_bounded([]) == ""
+
+    def test_fits_budget(self):
+        entries = [{"content": "Name ist Danny"}, {"content": "wohnt in Berlin"}]
+
+        assert _format_entries_bounded(entries) == "[0] Name ist Danny\n[1] wohnt in Berlin"
+
+    def test_budget_hit_mid_entry(self):
+        """Eintrag, der nicht mehr ganz reinpasst, fällt komplett weg - samt Rest."""
+        entries = [{"content": "a" * 10}, {"content": "b" * 10}, {"content": "c"}]
+        # "[0] aaaaaaaaaa\n" = 15 Zeichen, der zweite bräuchte weitere 15
+        result = _format_entries_bounded(entries, max_chars=20)
+
+        assert result == "[0] " + "a" * 10
+        assert len(result) <= 20
+
+    def test_exact_budget(self):
+        """Budget inklusive Zeilenumbruch genau getroffen → Eintrag bleibt drin."""
+        entries = [{"content": "a" * 10}, {"content": "b" * 10}]
+
+        assert _format_entries_bounded(entries, max_chars=30).count("\n") == 1
+
+    def test_single_oversized_entry_is_cut_per_entry(self):
+        """Ein riesiger Eintrag wird auf per_entry gekürzt, nicht komplett verworfen."""
+        result = _format_entries_bounded([{"content": "x" * 10_000}], max_chars=300, per_entry=200)
+
+        assert result == "[0] " + "x" * 200
+
+    def test_oversized_entry_beyond_budget(self):
+        """Passt selbst der gekürzte Eintrag nicht ins Budget → leerer String."""
+        assert _format_entries_bounded([{"content": "x" * 500}], max_chars=50, per_entry=200) == ""
+
+    def test_unnumbered_and_missing_content(self):
+        entries = [{"content": "eins"}, {}]
+
+        assert _format_entries_bounded(entries, numbered=False) == "eins\n"
+
+
+class TestCountOk:
+    """Tests für die Auswertung parallel gestarteter MCP-Calls."""
+
+    def test_only_successes_counted(self):
+        """Exceptions, None und Error-Dicts zählen nicht, landen aber in errors."""
+        errors = []
+        results = [
+            {"result": {"merged": 2}},
+            RuntimeError("timeout"),
+            None,
+            {"error": "Tool 'graph_merge_nodes' not found in any MCP"},
+            {"result": {"merged": 3}},
+        ]
+
+        assert _count_ok(results, "graph_merge_nodes", errors) == 2
+        assert len(errors) == 3
@@ -0,0 +1,39 @@
+# tests/test_memo.py
+"""
+Tests für den LLM-Ergebnis-Cache der Maintenance.
+"""
+
+from utils.memo import ResultCache
+
+
+class TestResultCache:
+    """Tests für Keys, Kopien und LRU-Verdrängung."""
+    
+    def test_key_depends_on_order_and_version(self):
+        """Reihenfolge und Prompt-Version gehen in den Key ein."""
+        key = ResultCache.make_key("v1", ["a", "b"])
+        
+        assert key == ResultCache.make_key("v1", ["a", "b"])
+        assert key != ResultCache.make_key("v1", ["b", "a"])
+        assert key != ResultCache.make_key("v2", ["a", "b"])
+    
+    def test_get_returns_copy(self):
+        """Veränderungen am Ergebnis landen nicht im Cache."""
+        cache = ResultCache()
+        cache.set("k", [{"indices": [0, 1]}])
+        
+        cache.get("k")[0]["indices"] = [9]
+        
+        assert cache.get("k") == [{"indices": [0, 1]}]
+    
+    def test_lru_eviction(self):
+        """Ältester, nicht genutzter Eintrag fliegt zuerst raus."""
+        cache = ResultCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert len(cache) == 2
@@ -0,0 +1,57 @@
+# tests/test_rkhash.py
+"""
+Tests für den Rabin-Karp Duplikat-Prefilter der Maintenance.
+"""
+
+from utils.rkhash import tokenize, rolling_hashes, jaccard, find_duplicate_groups
+
+
+class TestRollingHashes:
+    """Tests für Tokenizer und Rolling-Hash."""
+    
+    def test_tokenize_ignores_case_and_punctuation(self):
+        """Groß-/Kleinschreibung und Satzzeichen spielen keine Rolle."""
+        assert tokenize("Ich bin 30 Jahre alt.") == tokenize("ich bin 30 jahre alt")
+    
+    def test_rolling_matches_direct_hash(self):
+        """Rolling-Update ergibt dieselben Hashes wie die Einzelberechnung."""
+        tokens = tokenize("eins zwei drei vier fünf sechs sieben")
+        
+        direct = {rolling_hashes(tokens[i:i + 4], 4).pop() for i in range(len(tokens) - 3)}
+        
+        assert rolling_hashes(tokens, 4) == direct
+    
+    def test_short_text_single_hash(self):
+        """Texte kürzer als das Fenster ergeben genau einen Hash."""
+        assert len(rolling_hashes(tokenize("Hallo Welt"), 4)) == 1
+    
+    def test_empty_text(self):
+        """Leerer Text → leeres Set, Jaccard 0."""
+        assert rolling_hashes(tokenize("")) == set()
+        assert jaccard(set(), {1}) == 0.0
+
+
+class TestFindDuplicateGroups:
+    """Tests für die Gruppierung."""
+    
+    def test_near_exact_duplicates_grouped(self):
+        """Gleicher Text mit anderer Schreibweise landet in einer Gruppe."""
+        texts = [
+            "Ich bin 30 Jahre alt.",
+            "Mein Hund heißt Bello",
+            "ich bin 30 jahre alt",
+        ]
+        
+        assert find_duplicate_groups(texts) == [[0, 2]]
+    
+    def test_different_texts_not_grouped(self):
+        """Unterschiedliche Inhalte → keine Gruppen."""
+        texts = ["Mein Hund heißt Bello", "Das Wetter ist heute gut"]
+        
+        assert find_duplicate_groups(texts) == []
+    
+    def test_groups_are_transitive(self):
+        """A≈B und B≈C → eine Gruppe [A, B, C]."""
+        texts = ["Hallo Welt", "Hallo, Welt!", "hallo welt"]
+        
+        assert find_duplicate_groups(texts) == [[0, 1, 2]]
@@ -0,0 +1,51 @@
+# tests/test_sse.py
+"""
+Tests für die SSE-Helper der Maintenance-Streams.
+"""
+
+from adapters._sse import encode as sse, decode_first as parse_sse, FRAME_STREAM_END
+from adapters.lobechat.maintenance_smart_ai import PROGRESS_MESSAGES, PROGRESS_TEMPLATES
+
+
+class TestSse:
+    """Tests für Frame-Encoding und Parsing."""
+
+    def test_sse_frame_format(self):
+        """Frame hat data:-Prefix und Leerzeile am Ende."""
+        frame = sse({"type": "stream_end"})
+
+        assert frame == b'data: {"type":"stream_end"}\n\n'
+
+    def test_stream_end_constant(self):
+        """Vorencodierter stream_end-Frame entspricht encode()."""
+        assert FRAME_STREAM_END == sse({"type": "stream_end"})
+
+    def test_parse_first_data_line(self):
+        """Erste data:-Zeile wird geparst."""
+        body = b'event: message\ndata: {"result": {"ok": true}}\n\n'
+
+        assert parse_sse(body) == {"result": {"ok": True}}
+
+    def test_parse_data_at_start(self):
+        """data: direkt am Anfang, ohne abschließendes Newline."""
+        assert parse_sse(b'data: {"id": 1}') == {"id": 1}
+
+    def test_parse_crlf_line_endings(self):
+        """CRLF-Zeilenenden stören nicht."""
+        assert parse_sse(b'data: {"id": 2}\r\n\r\n') == {"id": 2}
+
+    def test_parse_no_data_line(self):
+        """Ohne data:-Zeile → None."""
+        assert parse_sse(b'event: ping\n\n') is None
+
+    def test_roundtrip(self):
+        """sse() → parse_sse() ergibt wieder das Original."""
+        payload = {"type": "status", "message": "Fertig: 3 → LTM"}
+
+        assert parse_sse(sse(payload)) == payload
+
+    def test_progress_templates_match_encode(self):
+        """Progress-Templates erzeugen dieselben Bytes wie encode()."""
+        for msg, template in zip(PROGRESS_MESSAGES, PROGRESS_TEMPLATES):
+            expected = sse({"type": "task_progress", "message": msg, "progress": 62})
+            assert template % 62 == expected
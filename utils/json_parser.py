@@ -14,8 +14,28 @@ Dieser Parser versucht mehrere Strategien.
 import json
 import re
 from typing import Any, Dict, Optional
+
+import orjson
 from utils.logger import log_warning, log_error, log_debug
 
+# Einmal kompiliert statt pro Aufruf über den re-Cache
+_CODEBLOCK_RE = re.compile(r'```(?:json)?\s*(\{[\s\S]*?\})\s*```')
+_TRAILING_COMMA_OBJ_RE = re.compile(r',\s*}')
+_TRAILING_COMMA_ARR_RE = re.compile(r',\s*]')
+_UNQUOTED_KEY_RE = re.compile(r'(\s*)(\w+)(\s*):')
+_TRUE_RE = re.compile(r'\bTrue\b')
+_FALSE_RE = re.compile(r'\bFalse\b')
+_NONE_RE = re.compile(r'\bNone\b')
+
+# Pattern für "key": "value" oder "key": true/false/number
+_KEY_VALUE_RES = [
+    re.compile(r'"(\w+)"\s*:\s*"([^"]*)"', re.IGNORECASE),           # "key": "string"
+    re.compile(r'"(\w+)"\s*:\s*(true|false)', re.IGNORECASE),         # "key": bool
+    re.compile(r'"(\w+)"\s*:\s*(\d+(?:\.\d+)?)', re.IGNORECASE),      # "key": number
+    re.compile(r'(\w+)\s*:\s*"([^"]*)"', re.IGNORECASE),              # key: "string" (unquoted key)
+    re.compile(r'(\w+)\s*:\s*(true|false)', re.IGNORECASE),           # key: bool (unquoted)
+]
+
 
 def safe_parse_json(
     raw: str, 
@@ -54,8 +74,7 @@ def safe_parse_json(
     
     # Strategie 3: JSON aus Markdown-Codeblock extrahieren
     # Matches: ```json {...} ``` oder ``` {...} ```
-    codeblock_pattern = r'```(?:json)?\s*(\{[\s\S]*?\})\s*```'
-    match = re.search(codeblock_pattern, raw)
+    match = _CODEBLOCK_RE.search(raw)
     if match:
         try:
             return json.loads(match.group(1))
@@ -86,6 +105,54 @@ def safe_parse_json(
     return default or {}
 
 
+def extract_first_json(text: str) -> Optional[Dict[str, Any]]:
+    """
+    Findet das erste vollständige {...}-Objekt in text (ein Durchlauf, O(n)).
+    
+    Zählt die Klammertiefe und ignoriert Klammern in String-Literalen.
+    Anders als ein gieriges Regex endet der Scan am ersten balancierten
+    Objekt - Text danach (oder ein noch unfertiger Stream) stört nicht.
+    
+    Returns:
+        Geparstes Dict oder None
+    """
+    start = text.find("{")
+    while start != -1:
+        depth = 0
+        in_string = False
+        escaped = False
+        
+        for i in range(start, len(text)):
+            c = text[i]
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif c == "\\":
+                    escaped = True
+                elif c == '"':
+                    in_string = False
+            elif c == '"':
+                in_string = True
+            elif c == "{":
+                depth += 1
+            elif c == "}":
+                depth -= 1
+                if depth == 0:
+                    try:
+                        result = orjson.loads(text[start:i + 1])
+                    except orjson.JSONDecodeError:
+                        break
+                    return result if isinstance(result, dict) else None
+        else:
+            # Objekt noch nicht geschlossen (z.B. Stream läuft noch)
+            return None
+        
+        # Kein gültiges JSON ab hier → nächste öffnende Klammer probieren
+        start = text.find("{", start + 1)
+    
+    return None
+
+
 def _attempt_json_repair(raw: str) -> Optional[str]:
     """
     Versucht häufige JSON-Fehler zu reparieren.
@@ -100,8 +167,8 @@ def _attempt_json_repair(raw: str) -> Optional[str]:
     
     # Fix 1: Trailing commas entfernen
     # ,} oder ,] → } oder ]
-    json_str = re.sub(r',\s*}', '}', json_str)
-    json_str = re.sub(r',\s*]', ']', json_str)
+    json_str = _TRAILING_COMMA_OBJ_RE.sub('}', json_str)
+    json_str = _TRAILING_COMMA_ARR_RE.sub(']', json_str)
     
     # Fix 2: Single quotes → Double quotes (vorsichtig)
     # Nur wenn keine double quotes vorhanden
@@ -110,12 +177,12 @@ def _attempt_json_repair(raw: str) -> Optional[str]:
     
     # Fix 3: Unquoted keys → Quoted keys
     # key: value → "key": value
-    json_str = re.sub(r'(\s*)(\w+)(\s*):', r'\1"\2"\3:', json_str)
+    json_str = _UNQUOTED_KEY_RE.sub(r'\1"\2"\3:', json_str)
     
     # Fix 4: True/False/None normalisieren
-    json_str = re.sub(r'\bTrue\b', 'true', json_str)
-    json_str = re.sub(r'\bFalse\b', 'false', json_str)
-    json_str = re.sub(r'\bNone\b', 'null', json_str)
+    json_str = _TRUE_RE.sub('true', json_str)
+    json_str = _FALSE_RE.sub('false', json_str)
+    json_str = _NONE_RE.sub('null', json_str)
     
     return json_str
 
@@ -130,17 +197,8 @@ def _extract_key_values(raw: str) -> Optional[Dict[str, Any]]:
     """
     result = {}
     
-    # Pattern für "key": "value" oder "key": true/false/number
-    patterns = [
-        r'"(\w+)"\s*:\s*"([^"]*)"',           # "key": "string"
-        r'"(\w+)"\s*:\s*(true|false)',         # "key": bool
-        r'"(\w+)"\s*:\s*(\d+(?:\.\d+)?)',      # "key": number
-        r'(\w+)\s*:\s*"([^"]*)"',              # key: "string" (unquoted key)
-        r'(\w+)\s*:\s*(true|false)',           # key: bool (unquoted)
-    ]
-    
-    for pattern in patterns:
-        matches = re.findall(pattern, raw, re.IGNORECASE)
+    for pattern in _KEY_VALUE_RES:
+        matches = pattern.findall(raw)
         for key, value in matches:
             # Type conversion
             if value.lower() == 'true':
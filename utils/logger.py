@@ -1,8 +1,29 @@
+import atexit
+import logging
+import queue
+import sys
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from config import LOG_LEVEL
 
 LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR"]
 
+# Handler-Threads legen die fertige Zeile nur in die Queue,
+# geschrieben wird von einem einzigen Listener-Thread (kein stdout-Lock im Request-Pfad)
+_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+
+_stdout_handler = logging.StreamHandler(sys.stdout)
+_stdout_handler.setFormatter(logging.Formatter("%(message)s"))
+
+_listener = QueueListener(_queue, _stdout_handler)
+_listener.start()
+atexit.register(_listener.stop)
+
+_logger = logging.getLogger("bridge")
+_logger.setLevel(logging.DEBUG)
+_logger.addHandler(QueueHandler(_queue))
+_logger.propagate = False
+
 
 def _should_log(level: str) -> bool:
     try:
@@ -17,7 +38,7 @@ def _log(level: str, msg: str):
     if not _should_log(level):
         return
     ts = datetime.utcnow().isoformat(timespec="seconds") + "Z"
-    print(f"[{ts}] [{level}] {msg}")
+    _logger.info(f"[{ts}] [{level}] {msg}")
 
 
 def log_debug(msg: str):
@@ -34,6 +55,6 @@ def log_warning(msg: str):
 
 def log_error(msg: str):
     _log("ERROR", msg)
-    
+
 def log_warn(msg: str):
-    print(f"[WARN] {msg}")
\ No newline at end of file
+    _logger.info(f"[WARN] {msg}")
@@ -0,0 +1,59 @@
+# utils/memo.py
+"""
+Memoization für teure LLM-Aufrufe.
+
+Key = Prompt-Version + Content-Hashes der Eingaben (in Reihenfolge,
+weil LLM-Antworten sich auf Indices beziehen). Unveränderte Daten
+sparen sich so den erneuten Ollama-Call.
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import Any, List, Optional
+
+import orjson
+
+
+def content_hash(text: str) -> str:
+    """Stabiler, kurzer Hash eines Textes."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+
+
+class ResultCache:
+    """
+    Kleiner LRU-Cache für JSON-serialisierbare Ergebnisse.
+
+    Werte werden als bytes abgelegt - get() liefert immer eine frische
+    Kopie, Aufrufer dürfen das Ergebnis also gefahrlos verändern.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, bytes]" = OrderedDict()
+
+    @staticmethod
+    def make_key(prompt_version: str, texts: List[str]) -> str:
+        """Key aus Prompt-Version + geordneten Content-Hashes."""
+        h = hashlib.blake2b(prompt_version.encode("utf-8"), digest_size=16)
+        for text in texts:
+            h.update(content_hash(text).encode("ascii"))
+        return h.hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        raw = self._data.get(key)
+        if raw is None:
+            return None
+        self._data.move_to_end(key)
+        return orjson.loads(raw)
+
+    def set(self, key: str, value: Any):
+        self._data[key] = orjson.dumps(value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self):
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,24 @@
+# utils/responses.py
+"""
+JSON-Responses via orjson + GZip-Einstellungen der Adapter-Apps.
+
+Eigene Klasse statt fastapi.responses.ORJSONResponse - die ist in neueren
+FastAPI-Versionen deprecated und warnt bei jeder Response.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from starlette.middleware.gzip import DEFAULT_EXCLUDED_CONTENT_TYPES
+
+# Token-Streams nicht komprimieren: pro Chunk ein winziger Deflate-Frame kostet CPU
+# und ist oft größer als der Chunk selbst. GZip bleibt für große JSON-Bodies.
+GZIP_EXCLUDE_CONTENT_TYPES = DEFAULT_EXCLUDED_CONTENT_TYPES + ("application/x-ndjson",)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse, serialisiert mit orjson (bytes direkt, kein json.dumps)."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
@@ -0,0 +1,106 @@
+# utils/rkhash.py
+"""
+Rabin-Karp Rolling-Hash für schnelle Near-Duplicate-Erkennung.
+
+Jeder Text wird in Wort-Tokens zerlegt, über Fenster von n Tokens
+(Shingles) wird ein Rolling-Hash gebildet. Zwei Texte mit
+Jaccard(Shingles) > Threshold gelten als Duplikat - ganz ohne LLM-Call.
+"""
+
+import re
+import zlib
+from typing import Dict, List, Set
+
+P = 60013
+MOD = 10**18 + 3
+
+# Memory-Einträge sind meist nur ein, zwei Sätze → kurze Shingles
+SHINGLE_SIZE = 4
+JACCARD_THRESHOLD = 0.8
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[int]:
+    """Text → stabile Token-IDs (lowercase, ohne Satzzeichen)."""
+    return [zlib.crc32(t.encode("utf-8")) for t in _TOKEN_RE.findall(text.lower())]
+
+
+def rolling_hashes(tokens: List[int], n: int = SHINGLE_SIZE) -> Set[int]:
+    """
+    Rolling-Hash über alle n-Token-Fenster.
+
+    Texte mit höchstens n Tokens ergeben genau einen Hash über alles.
+    """
+    if not tokens:
+        return set()
+
+    n = min(n, len(tokens))
+    high = pow(P, n - 1, MOD)
+
+    h = 0
+    for t in tokens[:n]:
+        h = (h * P + t) % MOD
+
+    hashes = {h}
+    for i in range(n, len(tokens)):
+        h = ((h - tokens[i - n] * high) * P + tokens[i]) % MOD
+        hashes.add(h)
+
+    return hashes
+
+
+def jaccard(a: Set[int], b: Set[int]) -> float:
+    """Jaccard-Ähnlichkeit zweier Hash-Sets."""
+    if not a or not b:
+        return 0.0
+    inter = len(a & b)
+    return inter / (len(a) + len(b) - inter)
+
+
+def find_duplicate_groups(
+    texts: List[str],
+    n: int = SHINGLE_SIZE,
+    threshold: float = JACCARD_THRESHOLD
+) -> List[List[int]]:
+    """
+    Gruppiert Texte mit Jaccard > threshold (transitiv, Union-Find).
+
+    Returns:
+        Liste von Index-Gruppen mit mindestens 2 Einträgen, z.B. [[0, 3], [5, 7, 12]]
+    """
+    shingles = [rolling_hashes(tokenize(t), n) for t in texts]
+    parent = list(range(len(texts)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    # Inverted Index: Jaccard > 0 setzt mindestens ein gemeinsames Shingle voraus,
+    # verglichen werden also nur Paare mit Überschneidung statt aller n² Paare
+    index: Dict[int, List[int]] = {}
+    for i, hashes in enumerate(shingles):
+        for h in hashes:
+            index.setdefault(h, []).append(i)
+
+    sizes = [len(hashes) for hashes in shingles]
+    
+    for i, hashes in enumerate(shingles):
+        # Schnittmenge direkt aus dem Index zählen statt Set-Intersection pro Paar
+        overlap: Dict[int, int] = {}
+        for h in hashes:
+            for j in index[h]:
+                if j > i:
+                    overlap[j] = overlap.get(j, 0) + 1
+        
+        for j, inter in overlap.items():
+            if inter / (sizes[i] + sizes[j] - inter) > threshold:
+                parent[find(j)] = find(i)
+
+    groups: Dict[int, List[int]] = {}
+    for i in range(len(texts)):
+        groups.setdefault(find(i), []).append(i)
+
+    return [g for g in groups.values() if len(g) >= 2]
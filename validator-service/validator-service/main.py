@@ -1,11 +1,24 @@
 from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel, Field
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, ConfigDict, Field
 import httpx
 import math
+import orjson
 import os
-from typing import List, Optional, Literal
+from typing import Any, List, Optional
 
-app = FastAPI(title="Embedding + LLM Validator Service")
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse via orjson (fastapi.responses.ORJSONResponse ist deprecated)."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+app = FastAPI(
+    title="Embedding + LLM Validator Service",
+    default_response_class=ORJSONResponse,
+)
 
 # ==== Basis-Konfiguration ====
 
@@ -18,29 +31,26 @@ VALIDATOR_MODEL = os.getenv("VALIDATOR_MODEL", "qwen2.5:0.5b-instruct")
 
 # ==== Embedding-Modelle (DEIN ALTER TEIL) ===================================
 
+# Pydantic nur für die Input-Validierung; Responses gehen als plain dict
+# über ORJSONResponse raus (kein zweiter Validierungs-/Encode-Durchlauf).
+# extra="ignore": unbekannte Keys werden wie bisher verworfen, Clients mit
+# zusätzlichen Feldern bekommen keinen 422.
+
 class ValidateRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
     question: str = Field(..., min_length=1)
     answer: str = Field(..., min_length=1)
     threshold: float = Field(0.7, ge=0.0, le=1.0)
 
 
-class ValidateResponse(BaseModel):
-    similarity: float
-    passed: bool
-    threshold: float
-    reason: str
-    details: dict
-
-
 class CompareRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
     text1: str = Field(..., min_length=1)
     text2: str = Field(..., min_length=1)
 
 
-class CompareResponse(BaseModel):
-    similarity: float
-
-
 async def get_embeddings(texts: List[str]) -> List[List[float]]:
     """
     Holt Embeddings von Ollama.
@@ -112,14 +122,14 @@ async def health():
     }
 
 
-@app.post("/compare", response_model=CompareResponse)
+@app.post("/compare")
 async def compare(req: CompareRequest):
     embeddings = await get_embeddings([req.text1, req.text2])
     sim = cosine_similarity(embeddings[0], embeddings[1])
-    return CompareResponse(similarity=sim)
+    return {"similarity": sim}
 
 
-@app.post("/validate", response_model=ValidateResponse)
+@app.post("/validate")
 async def validate(req: ValidateRequest):
     embeddings = await get_embeddings([req.question, req.answer])
     sim = cosine_similarity(embeddings[0], embeddings[1])
@@ -131,38 +141,31 @@ async def validate(req: ValidateRequest):
         else "similarity below threshold – possible drift/hallucination"
     )
 
-    return ValidateResponse(
-        similarity=sim,
-        passed=passed,
-        threshold=req.threshold,
-        reason=reason,
-        details={
+    return {
+        "similarity": sim,
+        "passed": passed,
+        "threshold": req.threshold,
+        "reason": reason,
+        "details": {
             "question_len": len(req.question),
             "answer_len": len(req.answer),
             "embedding_model": EMBEDDING_MODEL,
             "ollama_base_url": OLLAMA_BASE_URL,
         },
-    )
+    }
 
 # ==== NEU: LLM-BASED INSTRUCTION-FOLLOWING VALIDATOR =========================
 
 
 class LLMValidateRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
     question: str = Field(..., min_length=1)
     answer: str = Field(..., min_length=1)
     instruction: Optional[str] = ""
     rules: Optional[str] = ""
 
 
-class LLMValidateResponse(BaseModel):
-    final_result: Literal["pass", "fail"]
-    relevance: str
-    instruction_following: str
-    truthfulness: str
-    hallucination: str
-    raw_model_output: str
-
-
 LLM_VALIDATOR_SYSTEM_PROMPT = """
 Du bist ein strenger Evaluations-Agent für KI-Antworten.
 
@@ -215,7 +218,7 @@ def _extract_json_from_text(text: str) -> dict:
     return json.loads(json_str)
 
 
-@app.post("/validate_llm", response_model=LLMValidateResponse)
+@app.post("/validate_llm")
 async def validate_llm(req: LLMValidateRequest):
     """
     LLM-basierter Instruction-Following-Validator.
@@ -289,11 +292,11 @@ async def validate_llm(req: LLMValidateRequest):
     if hallucination == "yes" or relevance == "bad" or instruction_following == "bad":
         final_result = "fail"
 
-    return LLMValidateResponse(
-        final_result=final_result,
-        relevance=relevance,
-        instruction_following=instruction_following,
-        truthfulness=truthfulness,
-        hallucination=hallucination,
-        raw_model_output=raw_output,
-    )
\ No newline at end of file
+    return {
+        "final_result": final_result,
+        "relevance": relevance,
+        "instruction_following": instruction_following,
+        "truthfulness": truthfulness,
+        "hallucination": hallucination,
+        "raw_model_output": raw_output,
+    }
\ No newline at end of file